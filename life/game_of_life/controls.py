@@ -1,10 +1,11 @@
 """Input handling for keyboard controls."""
 
+import codecs
+import os
 import sys
 
 # Platform-specific imports
 if sys.platform != 'win32':
-    import select
     import termios
     import tty
 
@@ -15,13 +16,23 @@ class InputHandler:
     def __init__(self):
         """Initialize the input handler."""
         self.old_settings = None
+        # Bytes read from the terminal but not yet returned as keys
+        self._pending = ''
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
         if sys.platform != 'win32':
             self.old_settings = termios.tcgetattr(sys.stdin)
 
     def __enter__(self):
         """Set up non-blocking input mode."""
         if sys.platform != 'win32':
-            tty.setcbreak(sys.stdin.fileno())
+            fd = sys.stdin.fileno()
+            tty.setcbreak(fd)
+            # VMIN=0/VTIME=0: read() returns whatever is pending, or nothing,
+            # without blocking, so no select() is needed before reading
+            attrs = termios.tcgetattr(fd)
+            attrs[6][termios.VMIN] = 0
+            attrs[6][termios.VTIME] = 0
+            termios.tcsetattr(fd, termios.TCSANOW, attrs)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -29,6 +40,20 @@ class InputHandler:
         if sys.platform != 'win32' and self.old_settings:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
 
+    def get_keys(self):
+        """
+        Drain all pending key presses in a non-blocking way.
+
+        Returns:
+            List of pressed keys in arrival order (empty if none are pending)
+        """
+        keys = []
+        key = self.get_key()
+        while key is not None:
+            keys.append(key)
+            key = self.get_key()
+        return keys
+
     def get_key(self):
         """
         Get a key press in a non-blocking way.
@@ -58,13 +83,19 @@ class InputHandler:
                 return first_byte.decode('utf-8', errors='ignore')
             return None
         else:
-            # Unix/Mac
-            if select.select([sys.stdin], [], [], 0)[0]:
-                key = sys.stdin.read(1)
-                # Handle escape sequences
-                if key == '\x1b':
-                    # Try to read more characters for escape sequences
-                    if select.select([sys.stdin], [], [], 0.1)[0]:
-                        key += sys.stdin.read(2)
-                return key
-            return None
+            # Unix/Mac: one read() picks up every pending byte, so an arrow
+            # key's escape sequence normally arrives complete
+            if not self._pending:
+                data = os.read(sys.stdin.fileno(), 64)
+                if not data:
+                    return None
+                self._pending = self._decoder.decode(data)
+                if not self._pending:
+                    return None
+            # Handle escape sequences
+            if self._pending.startswith('\x1b[') and len(self._pending) >= 3:
+                key = self._pending[:3]
+            else:
+                key = self._pending[0]
+            self._pending = self._pending[len(key):]
+            return key
@@ -1,7 +1,10 @@
 """Terminal rendering with ANSI codes."""
 
+import shutil
 import sys
 
+import numpy as np
+
 
 class TerminalRenderer:
     """Renders the Game of Life grid to the terminal."""
@@ -16,11 +19,29 @@ class TerminalRenderer:
         """
         self.alive_char = alive_char
         self.dead_char = dead_char
+        # Maps the 0/1 cell bytes straight to display characters
+        self._cell_table = {0: dead_char, 1: alive_char}
+        # Lines of the last frame written, used to redraw only changed lines
+        self._prev_lines = None
+        # Terminal size the last frame was written for
+        self._term_size = None
+        # Title block and separator depend only on the grid width
+        self._frame_width = None
+        self._title_lines = None
+        self._separator = None
+        # Blank line plus the static controls footer
+        self._footer_lines = (
+            "",
+            "Controls:",
+            "  [SPACE] Pause/Play  [N] Next (when paused)  [R] Reset  [C] Clear  [X] Random",
+            "  [+/-] Speed  [1-9] Select pattern (position with arrows, [ENTER] confirm)  [Q/ESC] Quit",
+        )
 
     def clear_screen(self):
         """Clear the terminal screen using ANSI escape codes."""
         sys.stdout.write('\033[2J\033[H')
         sys.stdout.flush()
+        self._prev_lines = None
 
     def move_cursor_home(self):
         """Move cursor to home position without clearing screen."""
@@ -42,17 +63,19 @@ class TerminalRenderer:
             placement_x: X position of pattern preview
             placement_y: Y position of pattern preview
         """
-        # Move cursor to home instead of clearing to reduce flicker
-        self.move_cursor_home()
+        # Static title/separator lines are rebuilt only when the width changes
+        if grid.width != self._frame_width:
+            self._frame_width = grid.width
+            self._separator = "=" * (grid.width + 2)
+            self._title_lines = [
+                self._separator,
+                " Conway's Game of Life ".center(grid.width + 2),
+                self._separator,
+                "",
+            ]
 
         # Build frame as string buffer for efficient rendering
-        lines = []
-
-        # Title
-        lines.append("=" * (grid.width + 2))
-        lines.append(" Conway's Game of Life ".center(grid.width + 2))
-        lines.append("=" * (grid.width + 2))
-        lines.append("")
+        lines = list(self._title_lines)
 
         # Create preview grid if in placement mode
         display_grid = grid
@@ -60,12 +83,14 @@ class TerminalRenderer:
             display_grid = grid.copy()
             display_grid.place_pattern(placement_pattern, placement_x, placement_y)
 
-        # Grid visualization
-        for row in display_grid.grid:
-            line = ''.join(self.alive_char if cell else self.dead_char for cell in row)
-            lines.append(f"|{line}|")
+        # Grid visualization: translate the whole grid in one pass, then slice rows
+        width = display_grid.width
+        cells = (display_grid.grid != 0).astype(np.uint8).tobytes()
+        text = cells.decode('latin-1').translate(self._cell_table)
+        for start in range(0, len(text), width):
+            lines.append(f"|{text[start:start + width]}|")
 
-        lines.append("=" * (grid.width + 2))
+        lines.append(self._separator)
         lines.append("")
 
         # Status line
@@ -76,13 +101,31 @@ class TerminalRenderer:
             if paused:
                 status += " | PAUSED"
         lines.append(status)
-        lines.append("")
 
         # Controls footer
-        lines.append("Controls:")
-        lines.append("  [SPACE] Pause/Play  [N] Next (when paused)  [R] Reset  [C] Clear  [X] Random")
-        lines.append("  [+/-] Speed  [1-9] Select pattern (position with arrows, [ENTER] confirm)  [Q/ESC] Quit")
-
-        # Print entire frame at once
-        sys.stdout.write('\n'.join(lines))
-        sys.stdout.flush()
+        lines.extend(self._footer_lines)
+
+        # Print the frame in one write. After a clear (or if the layout
+        # changed) send every line; otherwise position the cursor on each
+        # changed line only. '\033[K' clears leftovers from longer lines.
+        # Cursor addressing assumes one terminal row per line, so a frame
+        # that wraps or scrolls, or a resized terminal, gets a full redraw.
+        prev = self._prev_lines
+        term_size = shutil.get_terminal_size()
+        fits = (len(lines) <= term_size.lines
+                and max(map(len, lines)) <= term_size.columns)
+        if term_size != self._term_size:
+            self._term_size = term_size
+            prev = None
+            if self._prev_lines is not None:
+                sys.stdout.write('\033[2J')  # reflowed leftovers of the old size
+        if prev is None or not fits or len(prev) != len(lines):
+            out = '\033[H' + '\033[K\n'.join(lines) + '\033[K'
+        else:
+            out = ''.join(f'\033[{i + 1};1H{line}\033[K'
+                          for i, (line, old) in enumerate(zip(lines, prev))
+                          if line != old)
+        self._prev_lines = lines
+        if out:
+            sys.stdout.write(out)
+            sys.stdout.flush()
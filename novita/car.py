@@ -114,6 +114,11 @@ for i in range(20):
     y = i * (line_height + line_gap)
     road_lines.append(pygame.Rect(road_x + road_width//2 - line_width//2, y, line_width, line_height))
 
+# Static backdrop (sky + road surface) — drawn once, blitted every frame
+background = pygame.Surface((WIDTH, HEIGHT)).convert()
+background.fill(SKY_BLUE)
+pygame.draw.rect(background, ROAD_GRAY, (road_x, 0, road_width, HEIGHT))
+
 
 # Draw the player car as a top-down F1-style racing car
 def draw_player_car(x, y, nitro):
@@ -253,6 +258,20 @@ def draw_president_car(x, y):
     screen.blit(label, (lx, ly))
 
 
+# HUD text cache — most HUD lines only change a few times per second, so
+# keep the rendered surface and skip font.render until the text changes
+hud_cache = {}
+
+
+def hud_text(text, color=TEXT_COLOR):
+    surf = hud_cache.get((text, color))
+    if surf is None:
+        if len(hud_cache) > 64:
+            hud_cache.clear()
+        surf = hud_cache[(text, color)] = font.render(text, True, color)
+    return surf
+
+
 def pick_spawn_x(width, margin=10, attempts=8):
     """Return a random road x that doesn't x-overlap with any on-screen item."""
     blocked = [obs[0] for obs in obstacles] + \
@@ -458,10 +477,8 @@ while running:
 
 
     # --- Rendering ---
-    screen.fill(SKY_BLUE)
-
-    # Road surface
-    pygame.draw.rect(screen, ROAD_GRAY, (road_x, 0, road_width, HEIGHT))
+    # Sky + road surface (pre-rendered)
+    screen.blit(background, (0, 0))
 
     # Oil spots (on road surface, under markings)
     for oil in oil_spots:
@@ -489,15 +506,15 @@ while running:
         draw_president_car(president[0], president[1])
 
     # HUD — left column
-    screen.blit(font.render(f"Score: {score}", True, TEXT_COLOR), (20, 20))
-    screen.blit(font.render(f"Dist:  {distance/1000:.2f} km", True, TEXT_COLOR), (20, 58))
+    screen.blit(hud_text(f"Score: {score}"), (20, 20))
+    screen.blit(hud_text(f"Dist:  {distance/1000:.2f} km"), (20, 58))
     next_km = (difficulty_level + 1) * DISTANCE_PER_LEVEL / 1000
-    screen.blit(font.render(f"Level: {difficulty_level}  (next {next_km:.0f} km)", True, TEXT_COLOR), (20, 96))
+    screen.blit(hud_text(f"Level: {difficulty_level}  (next {next_km:.0f} km)"), (20, 96))
     if nitro_active:
         label = f"NITRO! {nitro_timer // 60 + 1}s  (x{nitro_available} queued)"
-        screen.blit(font.render(label, True, (255, 200, 0)), (20, 134))
+        screen.blit(hud_text(label, (255, 200, 0)), (20, 134))
     elif nitro_available > 0:
-        screen.blit(font.render(f"NITRO x{nitro_available} READY [hold N]", True, NITRO_GREEN), (20, 134))
+        screen.blit(hud_text(f"NITRO x{nitro_available} READY [hold N]", NITRO_GREEN), (20, 134))
 
     # Level-up banner
     if level_up_timer > 0:
@@ -519,9 +536,9 @@ while running:
             screen.blit(warn, (WIDTH//2 - warn.get_width()//2, HEIGHT//2 - 26))
 
     # HUD — right / centre
-    lives_text = font.render(f"Lives: {lives}", True, TEXT_COLOR)
+    lives_text = hud_text(f"Lives: {lives}")
     screen.blit(lives_text, (WIDTH - lives_text.get_width() - 20, 20))
-    speed_text = font.render(f"Speed: {int(player_speed * 10)}", True, TEXT_COLOR)
+    speed_text = hud_text(f"Speed: {int(player_speed * 10)}")
     screen.blit(speed_text, (WIDTH//2 - speed_text.get_width()//2, 20))
 
     # Controls hint
@@ -25,6 +25,13 @@ stats_font = pygame.font.SysFont("Arial", 24)  # For in-game stats
 player_img = font.render("▲", True, (255, 255, 255))
 enemy_img = font.render("▼", True, (255, 0, 0))
 bullet_img = font.render("•", True, (255, 255, 0))
+# Match the display's pixel format once so blits take SDL's fast path
+player_img = player_img.convert_alpha()
+enemy_img = enemy_img.convert_alpha()
+bullet_img = bullet_img.convert_alpha()
+
+# Key constants used every frame by Player.update
+K_LEFT, K_RIGHT, K_SPACE = pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE
 
 # Background color (black for space)
 background_color = (0, 0, 0)
@@ -43,10 +50,8 @@ def get_spawn_interval(lives):
     elif lives == 1:
         return 500
 
-# Set initial spawn interval and timer event
-enemy_spawn_event = pygame.USEREVENT + 1
-current_spawn_interval = get_spawn_interval(lives)
-pygame.time.set_timer(enemy_spawn_event, current_spawn_interval)
+# Time of the last enemy spawn; the main loop spawns once the current interval has elapsed
+last_spawn_time = pygame.time.get_ticks()
 
 # Define the Player class
 class Player(pygame.sprite.Sprite):
@@ -62,11 +67,10 @@ class Player(pygame.sprite.Sprite):
 
     def update(self):
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] and self.rect.left > 0:
-            self.rect.x -= self.speed
-        if keys[pygame.K_RIGHT] and self.rect.right < SCREEN_WIDTH:
-            self.rect.x += self.speed
-        if keys[pygame.K_SPACE]:
+        # Net horizontal move from both arrow keys, clamped to the screen
+        dx = (keys[K_RIGHT] - keys[K_LEFT]) * self.speed
+        self.rect.x = max(0, min(SCREEN_WIDTH - self.rect.width, self.rect.x + dx))
+        if keys[K_SPACE]:
             now = pygame.time.get_ticks()
             if now - self.last_shot > self.shoot_delay:
                 self.last_shot = now
@@ -132,10 +136,46 @@ def spawn_enemy():
     all_sprites.add(enemy)
     enemies.add(enemy)
 
+# Rendered stats text, keyed by (score, lives, misses); only re-rendered on change
+stats_cache = {}
+
+# Height of the horizontal bands used to bucket bullets for collision checks
+BUCKET_H = 50
+
+# Function to resolve bullet/enemy collisions; returns the number of enemies hit.
+# Same result as groupcollide(enemies, bullets, True, True), but bullets are
+# bucketed by the horizontal bands they overlap so each enemy is only tested
+# against bullets in its own bands.
+def collide_bullets_with_enemies():
+    buckets = {}
+    for bullet in bullets:
+        for band in range(bullet.rect.top // BUCKET_H, (bullet.rect.bottom - 1) // BUCKET_H + 1):
+            buckets.setdefault(band, []).append(bullet)
+    hits = 0
+    for enemy in enemies.sprites():
+        hit = False
+        for band in range(enemy.rect.top // BUCKET_H, (enemy.rect.bottom - 1) // BUCKET_H + 1):
+            for bullet in buckets.get(band, ()):
+                if bullet.alive() and enemy.rect.colliderect(bullet.rect):
+                    bullet.kill()
+                    hit = True
+        if hit:
+            enemy.kill()
+            hits += 1
+    return hits
+
 # Function to draw score and lives information
 def draw_stats(surface, score, lives, misses):
-    score_text = stats_font.render(f"Score: {score}", True, (255, 255, 255))
-    lives_text = stats_font.render(f"Lives: {lives} (Misses: {misses}/5)", True, (255, 255, 255))
+    key = (score, lives, misses)
+    texts = stats_cache.get(key)
+    if texts is None:
+        if len(stats_cache) >= 32:
+            stats_cache.clear()
+        texts = stats_cache[key] = (
+            stats_font.render(f"Score: {score}", True, (255, 255, 255)),
+            stats_font.render(f"Lives: {lives} (Misses: {misses}/5)", True, (255, 255, 255)),
+        )
+    score_text, lives_text = texts
     surface.blit(score_text, (10, 10))
     surface.blit(lives_text, (10, 40))
 
@@ -161,24 +201,20 @@ running = True
 while running:
     clock.tick(FPS)
     
-    # Update spawn timer based on current lives
-    desired_interval = get_spawn_interval(lives)
-    if desired_interval != current_spawn_interval:
-        pygame.time.set_timer(enemy_spawn_event, desired_interval)
-        current_spawn_interval = desired_interval
+    # Spawn enemies at an interval based on current lives
+    now = pygame.time.get_ticks()
+    if now - last_spawn_time >= get_spawn_interval(lives):
+        spawn_enemy()
+        last_spawn_time = now
     
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == enemy_spawn_event:
-            spawn_enemy()
+    # QUIT is the only event handled here; drain the queue once and check for it
+    if any(event.type == pygame.QUIT for event in pygame.event.get()):
+        running = False
 
     all_sprites.update()
 
     # Check for collisions between bullets and enemies
-    hits = pygame.sprite.groupcollide(enemies, bullets, True, True)
-    for hit in hits:
-        score += 10  # Increase score for each enemy hit
+    score += 10 * collide_bullets_with_enemies()  # Increase score for each enemy hit
 
     # Check for game over condition
     if lives <= 0:
@@ -188,7 +224,8 @@ while running:
 
     # Render the game scene
     screen.fill(background_color)
-    all_sprites.draw(screen)
+    # One batched blit for every sprite instead of one blit call per sprite
+    screen.blits([(sprite.image, sprite.rect) for sprite in all_sprites], doreturn=0)
     draw_stats(screen, score, lives, misses)
     pygame.display.flip()
 
@@ -1,7 +1,8 @@
 """
 puzzles.py - Library of built-in Sudoku puzzles for the Sudoku tutor app.
 
-Each puzzle is stored as a list of 9 strings of 9 characters (0 = empty cell).
+Each puzzle is stored as a tuple of 9 ASCII bytes strings of 9 digits
+(b"0" = empty cell).
 
 Tier definitions (human-strategy difficulty):
   Tier 0: Really Easy — Full House and Naked Single only (no elimination needed)
@@ -13,19 +14,22 @@ Tier definitions (human-strategy difficulty):
 
 from __future__ import annotations
 
+from types import MappingProxyType
 
-def _rows(flat: str) -> list[str]:
-    """Convert a flat 81-char string into a list of 9 strings of length 9."""
+
+def _rows(flat: str) -> tuple[bytes, ...]:
+    """Convert a flat 81-char string into a tuple of 9 ASCII bytes of length 9."""
     assert len(flat) == 81, f"Expected 81 chars, got {len(flat)}"
-    return [flat[i * 9:(i + 1) * 9] for i in range(9)]
+    data = flat.encode("ascii")
+    return tuple(data[i * 9:(i + 1) * 9] for i in range(9))
 
 
 # ---------------------------------------------------------------------------
-# PUZZLES list  –  each entry: {name, tier, rows}
-# rows: list of 9 strings of 9 chars (0 = empty)
+# Puzzle entries  –  each: {name, tier, rows} (+ flat, givens below)
+# rows: tuple of 9 ASCII bytes of 9 digits (b"0" = empty)
 # ---------------------------------------------------------------------------
 
-PUZZLES: list[dict] = [
+_ENTRIES: list[dict] = [
 
     # -----------------------------------------------------------------------
     # TIER 0  –  Really Easy (Full House / Naked Single only)
@@ -507,19 +511,39 @@ PUZZLES: list[dict] = [
 
 ]
 
+# Precomputed per-puzzle stats: flat 81-byte grid and number of givens
+for _p in _ENTRIES:
+    _p["flat"] = b"".join(_p["rows"])
+    _p["givens"] = 81 - _p["flat"].count(b"0")
+del _p
+
+# The public library is read-only: a tuple of read-only mappings
+# (entries still support p["name"], p["rows"], ...)
+PUZZLES: tuple[MappingProxyType, ...] = tuple(MappingProxyType(p) for p in _ENTRIES)
+del _ENTRIES
+
 
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
 
-def get_puzzles_by_tier(tier: int) -> list[dict]:
+# Tier → puzzles index, built once since PUZZLES is fixed at import; tuples
+# so callers can't reorder or extend the shared lists
+_BY_TIER: dict[int, tuple[MappingProxyType, ...]] = {}
+for _p in PUZZLES:
+    _BY_TIER[_p["tier"]] = _BY_TIER.get(_p["tier"], ()) + (_p,)
+del _p
+_ALL_TIERS: tuple[int, ...] = tuple(sorted(_BY_TIER))
+
+
+def get_puzzles_by_tier(tier: int) -> tuple[MappingProxyType, ...]:
     """Return all puzzles for the given tier number."""
-    return [p for p in PUZZLES if p["tier"] == tier]
+    return _BY_TIER.get(tier, ())
 
 
-def get_all_tiers() -> list[int]:
-    """Return a sorted list of all tier numbers present in PUZZLES."""
-    return sorted(set(p["tier"] for p in PUZZLES))
+def get_all_tiers() -> tuple[int, ...]:
+    """Return a sorted tuple of all tier numbers present in PUZZLES."""
+    return _ALL_TIERS
 
 
 # ---------------------------------------------------------------------------
@@ -532,7 +556,5 @@ if __name__ == "__main__":
         puzzles = get_puzzles_by_tier(tier)
         print(f"  Tier {tier}: {len(puzzles)} puzzles")
         for p in puzzles:
-            flat = "".join(p["rows"])
-            given = sum(1 for c in flat if c != "0")
-            assert len(flat) == 81, f"Wrong length for {p['name']}"
-            print(f"    {p['name']}  ({given} givens)")
+            assert len(p["flat"]) == 81, f"Wrong length for {p['name']}"
+            print(f"    {p['name']}  ({p['givens']} givens)")
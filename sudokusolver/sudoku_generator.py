@@ -18,6 +18,7 @@ Difficulty tiers mirror those in sudoku_tutor.py:
 
 import random
 from copy import deepcopy
+from functools import lru_cache
 from typing import Optional
 
 from sudoku_tutor import Grid, Step, ALL_STRATEGIES
@@ -47,11 +48,20 @@ _EMPTY_RANGE = {
 # Strategy names that qualify as tier-0 (really easy)
 _TIER0_STRATEGY_NAMES = {"Full House", "Naked Single"}
 
+# ALL_STRATEGIES (already easiest-first) with each entry's tier looked up once;
+# used as the fallback when a step's own strategy name is not in STRATEGY_TIER
+_RATED_STRATEGIES = [(fn, STRATEGY_TIER.get(name, 0)) for name, fn in ALL_STRATEGIES]
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Solution Generator
 # ─────────────────────────────────────────────────────────────────────────────
 
+# (row, column, box) index of each flat cell position 0–80
+_CELL_UNITS = tuple((pos // 9, pos % 9, (pos // 27) * 3 + (pos % 9) // 3)
+                    for pos in range(81))
+
+
 def generate_solution(seed: int | None = None) -> list[list[int]]:
     """Generate a complete valid Sudoku solution using randomised backtracking.
 
@@ -64,96 +74,183 @@ def generate_solution(seed: int | None = None) -> list[list[int]]:
     -------
     A 9×9 list of ints (1–9), representing a fully-filled, valid Sudoku grid.
     """
+    return _to_rows(_solution_cells(seed))
+
+
+def _solution_cells(seed: int | None = None) -> bytearray:
+    """Like generate_solution, but return the grid as a flat 81-byte buffer."""
     rng = random.Random(seed)
-    grid = [[0] * 9 for _ in range(9)]
+    cells = bytearray(81)
+    # Digits already used per row / column / box, as bitmasks (bit d = digit d)
+    row_mask = [0] * 9
+    col_mask = [0] * 9
+    box_mask = [0] * 9
+    # Shuffled digit order per cell (None = not yet visited on this path)
+    # and the index of the next digit to try there
+    orders: list[list[int] | None] = [None] * 81
+    next_try = [0] * 81
+
+    # Iterative backtracking in reading order: advance on a placement,
+    # step back when a cell runs out of digits
+    pos = 0
+    while pos < 81:
+        r, c, b = _CELL_UNITS[pos]
+        digits = orders[pos]
+        if digits is None:
+            digits = orders[pos] = list(range(1, 10))
+            rng.shuffle(digits)
+            next_try[pos] = 0
+        elif cells[pos]:
+            # Returned here from a dead end: undo the previous choice
+            bit = 1 << cells[pos]
+            row_mask[r] ^= bit
+            col_mask[c] ^= bit
+            box_mask[b] ^= bit
+            cells[pos] = 0
+
+        forbidden = row_mask[r] | col_mask[c] | box_mask[b]
+        for i in range(next_try[pos], 9):
+            d = digits[i]
+            bit = 1 << d
+            if not forbidden & bit:
+                cells[pos] = d
+                row_mask[r] |= bit
+                col_mask[c] |= bit
+                box_mask[b] |= bit
+                next_try[pos] = i + 1
+                pos += 1
+                if pos < 81:
+                    orders[pos] = None
+                break
+        else:
+            orders[pos] = None
+            pos -= 1
 
-    def _is_valid(r: int, c: int, d: int) -> bool:
-        # Check row
-        if d in grid[r]:
-            return False
-        # Check column
-        if any(grid[rr][c] == d for rr in range(9)):
-            return False
-        # Check 3×3 box
-        br, bc = (r // 3) * 3, (c // 3) * 3
-        for dr in range(3):
-            for dc in range(3):
-                if grid[br + dr][bc + dc] == d:
-                    return False
-        return True
-
-    def _backtrack(pos: int) -> bool:
-        if pos == 81:
-            return True
-        r, c = divmod(pos, 9)
-        digits = list(range(1, 10))
-        rng.shuffle(digits)
-        for d in digits:
-            if _is_valid(r, c, d):
-                grid[r][c] = d
-                if _backtrack(pos + 1):
-                    return True
-                grid[r][c] = 0
-        return False
-
-    _backtrack(0)
-    return grid
+    return cells
+
+
+def _to_rows(cells: bytearray) -> list[list[int]]:
+    """Convert a flat 81-cell buffer to the 9×9 list-of-lists used by callers."""
+    return [list(cells[i:i + 9]) for i in range(0, 81, 9)]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Unique-Solution Check
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _count_solutions(cells: list[int], limit: int = 2) -> int:
+    """Count solutions of a flat 81-cell puzzle, stopping at *limit*.
+
+    Iterative backtracking over an explicit stack (no recursion), always
+    branching on the empty cell with the fewest candidates.  Used digits are
+    tracked as per-row / column / box bitmasks (bit d = digit d).
+
+    Parameters
+    ----------
+    cells:
+        81 ints in row-major order (list or bytearray), 0 = empty.
+        Not modified.
+    limit:
+        Stop searching once this many solutions have been found.
+
+    Returns
+    -------
+    The number of solutions found, at most *limit*.
+    """
+    cells = bytearray(cells)
+    row_mask = [0] * 9
+    col_mask = [0] * 9
+    box_mask = [0] * 9
+    empties = []
+    for pos, d in enumerate(cells):
+        if d:
+            bit = 1 << d
+            r, c, b = _CELL_UNITS[pos]
+            row_mask[r] |= bit
+            col_mask[c] |= bit
+            box_mask[b] |= bit
+        else:
+            empties.append(pos)
+
+    # Each stack entry is [pos, candidate bits not yet tried at pos]
+    stack = []
+    count = 0
+    while True:
+        # Pick the empty cell with the fewest candidates (MRV); a cell with
+        # none is a dead end, a cell with one is a forced move
+        best = -1
+        best_cands = 0
+        best_count = 10
+        for pos in empties:
+            if cells[pos] == 0:
+                r, c, b = _CELL_UNITS[pos]
+                cands = ~(row_mask[r] | col_mask[c] | box_mask[b]) & 0x3FE
+                n = cands.bit_count()
+                if n < best_count:
+                    best, best_cands, best_count = pos, cands, n
+                    if n <= 1:
+                        break
+        if best < 0:
+            # All cells filled — one more solution found
+            count += 1
+            if count >= limit:
+                return count
+        elif best_count:
+            stack.append([best, best_cands])
+
+        # Place the next untried candidate at the deepest level, undoing
+        # placements and popping exhausted levels as needed
+        while stack:
+            entry = stack[-1]
+            pos = entry[0]
+            r, c, b = _CELL_UNITS[pos]
+            if cells[pos]:
+                bit = 1 << cells[pos]
+                row_mask[r] ^= bit
+                col_mask[c] ^= bit
+                box_mask[b] ^= bit
+                cells[pos] = 0
+            cands = entry[1]
+            if cands:
+                bit = cands & -cands
+                entry[1] = cands ^ bit
+                cells[pos] = bit.bit_length() - 1
+                row_mask[r] |= bit
+                col_mask[c] |= bit
+                box_mask[b] |= bit
+                break
+            stack.pop()
+        else:
+            return count
+
+
 def _has_unique_solution(grid: list[list[int]]) -> bool:
     """Return True iff the puzzle has exactly one solution.
 
     Uses a lightweight backtracking solver that stops as soon as a second
     solution is discovered, keeping the check fast even for hard puzzles.
     """
-    # Work on a mutable copy
-    work = [row[:] for row in grid]
-    count = [0]  # mutable counter accessible from nested function
-
-    def _candidates(r: int, c: int) -> list[int]:
-        used = set()
-        used.update(work[r])
-        used.update(work[rr][c] for rr in range(9))
-        br, bc = (r // 3) * 3, (c // 3) * 3
-        for dr in range(3):
-            for dc in range(3):
-                used.add(work[br + dr][bc + dc])
-        return [d for d in range(1, 10) if d not in used]
-
-    def _solve() -> bool:
-        """Return True to signal early exit (second solution found)."""
-        # Find the first empty cell (simple left-to-right, top-to-bottom scan)
-        for pos in range(81):
-            r, c = divmod(pos, 9)
-            if work[r][c] == 0:
-                for d in _candidates(r, c):
-                    work[r][c] = d
-                    if _solve():
-                        return True
-                    work[r][c] = 0
-                return False  # dead end
-        # All cells filled — one more solution found
-        count[0] += 1
-        return count[0] >= 2  # True stops recursion early
-
-    _solve()
-    return count[0] == 1
+    return _count_solutions([d for row in grid for d in row]) == 1
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Difficulty Rater
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _rate_difficulty(values: list[list[int]]) -> int:
+def _rate_difficulty(values: list[list[int]], abort_above: int = 99) -> int:
     """Rate puzzle difficulty by simulating human-strategy solving.
 
     Applies ALL_STRATEGIES in order (hardest tried last only when easier ones
     are exhausted) until the puzzle is solved or no strategy fires.
 
+    Parameters
+    ----------
+    values:
+        9×9 list of ints (0 = empty cell).
+    abort_above:
+        Stop as soon as a step of a higher tier is needed and return that
+        tier; the exact rating is then unknown, only that it exceeds this.
+
     Returns
     -------
     int
@@ -161,21 +258,29 @@ def _rate_difficulty(values: list[list[int]]) -> int:
         Returns 0 if the puzzle cannot be solved by the implemented strategies
         (i.e. it requires bifurcation / trial-and-error).
     """
-    grid = Grid(values)
+    return _rate_cells(bytes(d for row in values for d in row), abort_above)
+
+
+@lru_cache(maxsize=1024)
+def _rate_cells(cells: bytes, abort_above: int = 99) -> int:
+    """Cached core of _rate_difficulty, keyed by the flat 81-byte board."""
+    grid = Grid(_to_rows(cells))
+    apply_step = grid.apply_step
+    tier_of = STRATEGY_TIER.get
     max_tier = 0
 
     while not grid.is_solved():
-        found = False
-        for name, fn in ALL_STRATEGIES:
+        for fn, fallback_tier in _RATED_STRATEGIES:
             step = fn(grid)
             if step is not None:
-                tier = STRATEGY_TIER.get(step.strategy, STRATEGY_TIER.get(name, 0))
+                tier = tier_of(step.strategy, fallback_tier)
                 if tier > max_tier:
                     max_tier = tier
-                grid.apply_step(step)
-                found = True
+                    if max_tier > abort_above:
+                        return max_tier  # already too hard for the caller
+                apply_step(step)
                 break  # restart strategy loop from the easiest strategy
-        if not found:
+        else:
             return 0  # stuck — unsolvable by human strategies
 
     return max_tier
@@ -218,13 +323,16 @@ def generate_puzzle(
     Algorithm
     ---------
     1. Generate a complete, random solution.
-    2. Collect all 81 cells in a random order.
-    3. Remove cells one by one; after each removal verify that the puzzle
-       still has a unique solution.  Skip cells whose removal would create
-       multiple solutions.
+    2. Collect the 41 rotationally symmetric cell pairs (r, c)/(8-r, 8-c),
+       centre included, in a random order.
+    3. Remove pairs one at a time; after each removal verify that the puzzle
+       still has a unique solution (holes left with a single candidate are
+       accepted without running the solver).  Skip pairs whose removal
+       would create multiple solutions.
     4. Stop the removal loop when either:
-         a. Every cell has been visited, or
+         a. Every pair has been visited, or
          b. The number of empty cells reaches the upper bound for the tier.
+       If still short of the tier's minimum, continue with single cells.
     5. Rate the resulting puzzle.  Accept it when the rated tier is within
        ±1 of the target, or when target_tier >= 4 and the puzzle needs brute
        force (rated 0).
@@ -251,40 +359,82 @@ def generate_puzzle(
     for attempt in range(max_attempts):
         # Derive a per-attempt seed so each attempt explores a different space
         attempt_seed = rng.randint(0, 2**31 - 1)
-        solution = generate_solution(seed=attempt_seed)
-
-        # Start with the full solution; we will punch holes in it
-        puzzle = [row[:] for row in solution]
+        # Start with the full solution (flat, index r*9+c); we will punch holes in it
+        puzzle = _solution_cells(seed=attempt_seed)
 
-        # Random cell removal order
+        # Random removal order over rotationally symmetric pairs
+        # (pos, 80 - pos); the centre cell 40 is its own partner
         attempt_rng = random.Random(attempt_seed)
-        cells = list(range(81))
-        attempt_rng.shuffle(cells)
+        pairs = list(range(41))
+        attempt_rng.shuffle(pairs)
+
+        # Digits still given per row / column / box (bit d = digit d)
+        row_mask = [0x3FE] * 9
+        col_mask = [0x3FE] * 9
+        box_mask = [0x3FE] * 9
+
+        def _punch(group: tuple[int, ...]) -> bool:
+            """Empty the cells in *group*; keep them empty iff uniqueness holds."""
+            saved = [puzzle[pos] for pos in group]
+            forced = True
+            for pos in group:
+                r, c, b = _CELL_UNITS[pos]
+                bit = 1 << puzzle[pos]
+                puzzle[pos] = 0
+                row_mask[r] ^= bit
+                col_mask[c] ^= bit
+                box_mask[b] ^= bit
+                # A hole whose peers leave exactly one candidate is a naked
+                # single.  If every hole is one at the time it is emptied, the
+                # group refills in reverse order by forced moves, so uniqueness
+                # holds without running the solver
+                used = row_mask[r] | col_mask[c] | box_mask[b]
+                forced = forced and (~used & 0x3FE).bit_count() == 1
+            if forced or _count_solutions(puzzle) == 1:
+                return True
+            # Restore — removing these cells breaks uniqueness
+            for pos, d in zip(group, saved):
+                r, c, b = _CELL_UNITS[pos]
+                bit = 1 << d
+                puzzle[pos] = d
+                row_mask[r] |= bit
+                col_mask[c] |= bit
+                box_mask[b] |= bit
+            return False
 
         empty_count = 0
-        for pos in cells:
-            r, c = divmod(pos, 9)
-            saved = puzzle[r][c]
-            puzzle[r][c] = 0
-
-            if _has_unique_solution(puzzle):
-                empty_count += 1
+        for p in pairs:
+            group = (p,) if p == 40 else (p, 80 - p)
+            if empty_count + len(group) <= empty_max and _punch(group):
+                empty_count += len(group)
                 if empty_count >= empty_max:
                     break  # hit the upper bound for this tier
-            else:
-                # Restore — removing this cell breaks uniqueness
-                puzzle[r][c] = saved
+
+        # Symmetric removal rarely reaches the emptiest tiers; top up with
+        # single cells in random order when it falls short
+        if empty_count < empty_min:
+            remaining = [pos for pos in range(81) if puzzle[pos]]
+            attempt_rng.shuffle(remaining)
+            for pos in remaining:
+                if _punch((pos,)):
+                    empty_count += 1
+                    if empty_count >= empty_max:
+                        break
 
         # Only proceed if we have at least the minimum number of empty cells
         if empty_count < empty_min:
             continue
 
+        # Grid (and callers) take the 9×9 form
+        values = _to_rows(puzzle)
+
         # Rate the puzzle
         if target_tier == 0:
             # Tier-0: must be solvable by Full House + Naked Single only
-            acceptable = _is_tier0(puzzle)
+            acceptable = _is_tier0(values)
         else:
-            tier = _rate_difficulty(puzzle)
+            # Anything above target_tier + 1 is rejected, so stop rating there
+            tier = _rate_cells(bytes(puzzle), target_tier + 1)
             # Accept criteria:
             #   - Exact tier match, or within ±1
             #   - For tier-4 target: also accept unsolvable-by-strategies (tier==0),
@@ -295,7 +445,7 @@ def generate_puzzle(
             )
 
         if acceptable:
-            return puzzle
+            return values
 
     # All attempts exhausted
     return None
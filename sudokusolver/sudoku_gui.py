@@ -25,14 +25,16 @@ Drop an image file onto the window to extract a puzzle via Claude API.
 Right-click any cell (solve mode): toggle pencilmarks
 """
 
-import sys, json, os, threading
-from copy import deepcopy
+import sys, json, os, signal
+import multiprocessing
+from collections import OrderedDict, defaultdict, namedtuple
+from multiprocessing.connection import Connection
 from pathlib import Path
 
 import pygame
 
 from sudoku_tutor import (
-    Grid, Step, ALL_STRATEGIES, DEFAULT_PUZZLE, read_puzzle,
+    Grid, Step, ALL_STRATEGIES, DEFAULT_PUZZLE, PEERS, read_puzzle,
 )
 
 # ── Optional imports ──────────────────────────────────────────────────────────
@@ -40,7 +42,7 @@ try:
     from puzzles import PUZZLES, get_puzzles_by_tier, get_all_tiers
     HAS_PUZZLES = True
 except ImportError:
-    PUZZLES, HAS_PUZZLES = [], False
+    PUZZLES, HAS_PUZZLES = (), False
 
 try:
     from sudoku_generator import generate_puzzle
@@ -121,9 +123,31 @@ BTN_Y       = TIMELINE_Y + TIMELINE_H + 8        # 628
 WIN_W       = PANEL_X + PANEL_W + MARGIN          # 944
 WIN_H       = BTN_Y + BTN_H + MARGIN              # 680
 
+# Screen regions repainted independently by SudokuApp.draw_dirty
+GRID_AREA   = pygame.Rect(GRID_X - 2, GRID_Y - 2, GRID_PX + 4, GRID_PX + 4)
+PANEL_AREA  = pygame.Rect(PANEL_X, GRID_Y, PANEL_W, GRID_PX)
+TIMELINE_AREA = pygame.Rect(0, TIMELINE_Y - 2, WIN_W, TIMELINE_H + 4)
+BTN_AREA    = pygame.Rect(0, BTN_Y, WIN_W, WIN_H - BTN_Y)   # buttons + filter label
+
 SUBCELL_W   = CELL_SIZE // 3
 SUBCELL_H   = CELL_SIZE // 3
 PANEL_SURF_H = 1400
+# Centre of digit d's pencilmark within a cell, indexed by d-1
+_CAND_CENTER = tuple(((k % 3) * SUBCELL_W + SUBCELL_W // 2,
+                      (k // 3) * SUBCELL_H + SUBCELL_H // 2) for k in range(9))
+_LINE_KEY    = (255, 0, 255)    # transparent colour of the cached grid-line layer
+_CARET_BLINK = pygame.USEREVENT # timer event toggling the _text_dialog caret
+# Rendered panel lines kept before SudokuApp._text starts over
+_TEXT_CACHE_MAX = 512
+# Word widths kept by SudokuApp._word_width before it starts over
+_WORD_WIDTH_CACHE_MAX = 4096
+# Step bodies kept by SudokuApp._step_body for scrubbing back and forth
+_STEP_BODY_CACHE_MAX = 32
+# Boards whose backtracking result SudokuApp._bt_solve_cached remembers
+_BT_CACHE_MAX = 8
+
+# Step highlight tags stored per cell in SudokuApp.highlight, in priority order
+_HL_NONE, _HL_HOUSE, _HL_PATTERN, _HL_ELIM, _HL_PLACE = range(5)
 
 # ── Colour palettes ───────────────────────────────────────────────────────────
 LIGHT: dict = {
@@ -205,6 +229,11 @@ DARK: dict = {
     "strategy_fg":  ( 90, 145, 230),
 }
 
+# Attribute-access views of the palettes; a misspelt colour name raises
+Palette = namedtuple("Palette", LIGHT)
+LIGHT_P = Palette(**LIGHT)
+DARK_P  = Palette(**DARK)
+
 # ── Strategy tier ─────────────────────────────────────────────────────────────
 STRATEGY_TIER: dict[str, int] = {
     "Full House": 1, "Naked Single": 1, "Hidden Single": 1,
@@ -234,45 +263,112 @@ BUTTONS = [
     {"id": "apikey", "label": "API KEY"},
 ]
 
+# ── Cell navigation ───────────────────────────────────────────────────────────
+_ARROW_DELTAS = {
+    pygame.K_UP:    (-1, 0),
+    pygame.K_DOWN:  (1, 0),
+    pygame.K_LEFT:  (0, -1),
+    pygame.K_RIGHT: (0, 1),
+}
+# Cursor position after entering a digit at r*9+c: next cell in reading
+# order, wrapping to the row start on the last cell
+_NEXT_CELL = tuple(divmod(i + 1, 9) for i in range(80)) + ((8, 0),)
+# Digit typed by each number-row and keypad key, independent of layout/shift
+_DIGIT_KEYS = dict(zip(range(pygame.K_0, pygame.K_9 + 1), range(10)))
+_DIGIT_KEYS.update(zip((pygame.K_KP0, pygame.K_KP1, pygame.K_KP2, pygame.K_KP3,
+                        pygame.K_KP4, pygame.K_KP5, pygame.K_KP6, pygame.K_KP7,
+                        pygame.K_KP8, pygame.K_KP9), range(10)))
+
 # ── Backtracking solver ───────────────────────────────────────────────────────
-def _bt_candidates(grid: list[list[int]], r: int, c: int) -> set[int]:
-    used: set[int] = set()
-    for cc in range(9): used.add(grid[r][cc])
-    for rr in range(9): used.add(grid[rr][c])
+def _bt_candidates(grid: list[list[int]], r: int, c: int) -> int:
+    # Bitmask of digits still free at (r, c): bit d-1 = digit d
+    used = 0
+    for cc in range(9): used |= 1 << grid[r][cc]
+    for rr in range(9): used |= 1 << grid[rr][c]
     br, bc = (r // 3) * 3, (c // 3) * 3
     for dr in range(3):
         for dc in range(3):
-            used.add(grid[br+dr][bc+dc])
-    return set(range(1, 10)) - used
+            used |= 1 << grid[br+dr][bc+dc]
+    return ~used >> 1 & 0x1FF
+
+# Bit r2*9+c2 of _PEER_MASK[r*9+c] is set when (r2, c2) is a peer of (r, c)
+_PEER_MASK = [sum(1 << (r2 * 9 + c2) for r2, c2 in peers) for peers in PEERS]
+
+# (row, col, box) of each flat cell index r*9+c
+_BT_UNITS = tuple((i // 9, i % 9, (i // 27) * 3 + (i % 9) // 3) for i in range(81))
 
 def _bt_solve(grid: list[list[int]], _iters: list[int] | None = None) -> list[list[int]] | None:
-    if _iters is not None:
-        _iters[0] += 1
-    best_r, best_c, best_cands = -1, -1, None
-    for r in range(9):
-        for c in range(9):
-            if grid[r][c] == 0:
-                cands = _bt_candidates(grid, r, c)
-                if not cands:
-                    return None
-                if best_cands is None or len(cands) < len(best_cands):
-                    best_r, best_c, best_cands = r, c, cands
-                    if len(best_cands) == 1:
+    # Flat board plus used-digit bitmasks per row/col/box (bit d-1 = digit d);
+    # branch on the empty cell with fewest candidates, undo mask bits on backtrack
+    cells = bytearray(v for row in grid for v in row)
+    row_mask, col_mask, box_mask = [0] * 9, [0] * 9, [0] * 9
+    for i, d in enumerate(cells):
+        if d:
+            r, c, b = _BT_UNITS[i]
+            bit = 1 << (d - 1)
+            row_mask[r] |= bit; col_mask[c] |= bit; box_mask[b] |= bit
+    empties = [i for i in range(81) if not cells[i]]
+
+    def search() -> bool:
+        if _iters is not None:
+            _iters[0] += 1
+        best, best_free, best_n = -1, 0, 10
+        for i in empties:
+            if not cells[i]:
+                r, c, b = _BT_UNITS[i]
+                free = ~(row_mask[r] | col_mask[c] | box_mask[b]) & 0x1FF
+                n = free.bit_count()
+                if n < best_n:
+                    if not n:
+                        return False
+                    best, best_free, best_n = i, free, n
+                    if n == 1:
                         break
-        if best_cands and len(best_cands) == 1:
-            break
-    if best_r == -1:
-        return grid
-    for d in sorted(best_cands):   # type: ignore[arg-type]
-        grid[best_r][best_c] = d
-        result = _bt_solve([row[:] for row in grid], _iters)
-        if result is not None:
-            return result
-        grid[best_r][best_c] = 0
-    return None
+        if best == -1:
+            return True
+        r, c, b = _BT_UNITS[best]
+        while best_free:
+            bit = best_free & -best_free
+            best_free ^= bit
+            cells[best] = bit.bit_length()
+            row_mask[r] |= bit; col_mask[c] |= bit; box_mask[b] |= bit
+            if search():
+                return True
+            row_mask[r] ^= bit; col_mask[c] ^= bit; box_mask[b] ^= bit
+        cells[best] = 0
+        return False
+
+    if not search():
+        return None
+    return [list(cells[i:i + 9]) for i in range(0, 81, 9)]
+
+# ── Packed grid snapshots (see Grid.snapshot) ───────────────────────────────
+def _snap_rows(values: bytes) -> list[list[int]]:
+    return [list(values[i:i + 9]) for i in range(0, 81, 9)]
+
+def _cand_bits(cands: bytes, i: int) -> int:
+    return cands[2 * i] | (cands[2 * i + 1] << 8)
 
 # ── Board validation ──────────────────────────────────────────────────────────
+def _board_has_duplicates(values: list[list[int]]) -> bool:
+    # One pass with per-row/col/box digit bitmasks (bit d = digit d)
+    row_mask, col_mask, box_mask = [0] * 9, [0] * 9, [0] * 9
+    for r in range(9):
+        row = values[r]
+        for c in range(9):
+            v = row[c]
+            if v:
+                bit = 1 << v
+                b = (r // 3) * 3 + c // 3
+                if (row_mask[r] | col_mask[c] | box_mask[b]) & bit:
+                    return True
+                row_mask[r] |= bit; col_mask[c] |= bit; box_mask[b] |= bit
+    return False
+
 def validate_board(values: list[list[int]]) -> set[tuple[int, int]]:
+    # Common case is a clean board: skip the per-house dict scans entirely
+    if not _board_has_duplicates(values):
+        return set()
     conflicts: set[tuple[int, int]] = set()
     for r in range(9):
         seen: dict[int, int] = {}
@@ -385,6 +481,87 @@ def rate_puzzle(steps: list[Step]) -> int:
     return max(STRATEGY_TIER.get(s.strategy, 0) for s in steps)
 
 
+def _elimination_lines(step: Step) -> list[str]:
+    """Panel lines for a step's eliminations, one per cell, digits sorted."""
+    by_cell: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+    for r, c, d in step.eliminations:
+        by_cell[(r, c)].append(d)
+    return [f"  R{r+1}C{c+1}: {{{','.join(map(str, sorted(ds)))}}}"
+            for (r, c), ds in by_cell.items()]
+
+
+def _step_line(idx: int, step: Step) -> str:
+    """Entry for step number idx in the panel's ALL STEPS list."""
+    placements = ", ".join(f"R{r+1}C{c+1}={d}" for r, c, d in step.placements)
+    return f"{idx:2}. {placements or '—'}  [{step.strategy}]"
+
+
+# ── Step computation (runs in a worker process) ───────────────────────────────
+_SNAP_SIZE = 81 + 162   # packed values + candidate masks, see Grid.snapshot
+
+def _compute_steps(initial_values: list[list[int]]) -> tuple:
+    """Solve with human strategies; return (steps, packed_states, stuck, conflict_cells).
+
+    packed_states is every step's Grid.snapshot() concatenated into one
+    bytes blob, _SNAP_SIZE bytes per state, so it pickles in one piece.
+    """
+    steps: list[Step] = []
+    stuck = False
+    grid_states: list[tuple[bytes, bytes]] = []
+    conflict_cells: set = set()
+
+    init_conflicts = validate_board(initial_values)
+    if init_conflicts:
+        conflict_cells = init_conflicts
+        grid_states    = [Grid(initial_values).snapshot()]
+        stuck          = True
+    else:
+        grid = Grid(initial_values)
+        grid_states = [grid.snapshot()]
+        while not grid.is_solved():
+            step = None
+            for _, fn in ALL_STRATEGIES:
+                step = fn(grid)
+                if step:
+                    break
+            if step is None:
+                stuck = True
+                break
+            steps.append(step)
+            grid.apply_step(step)
+            conflicts = validate_board(grid.values)
+            if conflicts:
+                conflict_cells = conflicts
+                grid_states.append(grid.snapshot())
+                stuck = True
+                break
+            grid_states.append(grid.snapshot())
+
+    packed = b"".join(values + cands for values, cands in grid_states)
+    return steps, packed, stuck, conflict_cells
+
+
+def _compute_worker(conn: Connection) -> None:
+    """Solve each puzzle sent over conn until the parent closes its end."""
+    # A forked worker inherits SDL's SIGTERM handler, which only queues a
+    # quit event; restore the default so the terminate() multiprocessing
+    # sends daemon children at exit really stops it
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    while True:
+        try:
+            initial_values = conn.recv()
+        except EOFError:
+            break
+        conn.send(_compute_steps(initial_values))
+    conn.close()
+
+
+def _generate_process(target_tier: int, conn: Connection) -> None:
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)   # see _compute_worker
+    conn.send(generate_puzzle(target_tier=min(target_tier, 4), max_attempts=30))
+    conn.close()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Main application
 # ─────────────────────────────────────────────────────────────────────────────
@@ -400,15 +577,24 @@ class SudokuApp:
         self.clock  = pygame.time.Clock()
         self.fonts  = _load_fonts()
 
-        cfg = load_config()
+        # Settings as loaded from ~/.sudokurc; written back once, on quit,
+        # and only if something changed
+        cfg = self.cfg = load_config()
 
         # ── Solver state ──────────────────────────────────────────────────────
         self.initial_values:  list[list[int]] = []
-        self.grid_states:     list[Grid]      = []
+        # Derived from initial_values in compute_all_steps_async
+        self._initial_givens: list[list[bool]] = []
+        self._initial_empty:  int             = 0
+        self.grid_states:     list[tuple[bytes, bytes]] = []
         self.steps:           list[Step]      = []
+        self._elim_lines:     list[list[str]] = []   # per step, see _elimination_lines
+        self._step_lines:     list[str]       = []   # per step, see _step_line
+        self._placed_by:      list[int]       = [-1] * 81   # first step placing r*9+c
+        self._timeline_ticks: list[int]       = []   # tick x positions for draw_timeline
         self.step_idx:        int             = 0
-        self.highlight:       dict            = {}
-        self.elim_set:        set             = set()
+        self.highlight:       bytearray       = bytearray(81)   # _HL_* tag per r*9+c
+        self.elim_masks:      list[int]       = [0] * 81        # eliminated digits, bit d-1
         self.conflict_cells:  set             = set()
         self.show_candidates: bool            = cfg.get("show_candidates", True)
         self.auto_play:       bool            = False
@@ -421,7 +607,16 @@ class SudokuApp:
 
         # ── Async computation ─────────────────────────────────────────────────
         self._computing:       bool = False
-        self._compute_ready:   bool = False   # set by thread when done
+        self._compute_proc:    multiprocessing.Process | None = None
+        self._compute_conn:    Connection | None = None   # parent end of the job pipe
+        self._gen_proc:        multiprocessing.Process | None = None
+        self._gen_conn:        Connection | None = None   # parent end of the generator pipe
+
+        # Set whenever something on screen may have changed; cleared by draw()
+        self._dirty:           bool = True
+        # Regions to repaint when only part of the screen changed (hover,
+        # panel scroll); drained by draw_dirty, ignored once _dirty is set
+        self._dirty_rects:     list[pygame.Rect] = []
 
         # ── UI state ──────────────────────────────────────────────────────────
         self.dark_mode:       bool            = cfg.get("dark_mode", False)
@@ -433,8 +628,34 @@ class SudokuApp:
         self.panel_scroll:    int             = 0
         self.filter_digit:    int             = 0     # 0=off, 1-9=filter
 
-        # pencilmark overrides: user_cands[(r,c)] = set of toggled digits
-        self.user_cands:      dict           = {}
+        # pencilmark overrides: user_cands[(r,c)] = bitmask of toggled digits (bit d-1)
+        self.user_cands:      dict[tuple[int, int], int] = {}
+
+        # ── Cached grid layers ────────────────────────────────────────────────
+        # Lines per palette; lines + givens per (palette, initial values)
+        self._grid_lines:     dict[bool, pygame.Surface] = {}
+        self._static_bg:      pygame.Surface | None = None
+        self._static_key:     tuple | None    = None
+        # Rendered digit glyphs keyed by (font name, digit, colour)
+        self._glyph_cache:    dict[tuple, pygame.Surface] = {}
+        # Button labels with their centred dest rects, per palette
+        self._btn_labels:     dict[bool, dict[str, tuple]] = {}
+        # Rendered panel lines keyed by (font name, text, colour)
+        self._text_cache:     dict[tuple, pygame.Surface] = {}
+        # Word widths for _wrapped keyed by (id(font), word)
+        self._word_widths:    dict[tuple, int] = {}
+        # Rendered step bodies keyed by (step_idx, dark_mode), least recent first
+        self._step_bodies:    OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        # Full-height info panel, re-rendered only when its content may have
+        # changed; scrolling just moves the viewport over it
+        self._panel_surf:     pygame.Surface | None = None
+        self._panel_content_h: int            = 0
+        self._panel_stale:    bool            = True
+        # (line, dest) pairs queued by the _panel_* methods during a rebuild
+        self._panel_blits:    list[tuple[pygame.Surface, tuple]] = []
+        self._compute_dim:    pygame.Surface | None = None
+        # (glyph, dest) pairs queued by draw_cell during one draw_grid pass
+        self._cell_blits:     list[tuple[pygame.Surface, pygame.Rect]] = []
 
         # ── Create mode ───────────────────────────────────────────────────────
         self.create_values:   list[list[int]] | None = None
@@ -446,8 +667,12 @@ class SudokuApp:
         self.play_solution:   list[list[int]] | None = None
         self.hint_level:      int             = 0    # 0=none shown; advances 0→4→0
         self.hint_step_idx:   int             = -1   # which step hint refers to
-        self.play_user_cands: dict            = {}   # (r,c) -> set of user-entered candidates
+        self.play_user_cands: dict[tuple[int, int], int] = {}   # (r,c) -> bitmask of user-entered candidates
         self.play_cand_mode:  bool            = False # True=mark mode, False=fill mode
+        self._next_hint_idx:  int             = 0    # first step not yet filled in
+        self._play_wrong:     int             = 0    # cells differing from play_solution
+        # (solution, iterations) per 81-byte board, least recent first
+        self._bt_results:     OrderedDict[bytes, tuple] = OrderedDict()
 
         # ── Claude API ────────────────────────────────────────────────────────
         self.anthropic_api_key: str = (
@@ -456,6 +681,8 @@ class SudokuApp:
 
         self.btn_rects: dict = {}
         self._compute_btn_rects()
+        # Button under the mouse; tracked from MOUSEMOTION, re-read on full draws
+        self._hovered_bid: str | None = None
 
         # ── Load puzzle ───────────────────────────────────────────────────────
         source = puzzle_file or cfg.get("last_puzzle", "sd0.txt")
@@ -472,8 +699,8 @@ class SudokuApp:
     # ──────────────────────────────────────────────────────────────────────────
 
     @property
-    def p(self) -> dict:
-        return DARK if self.dark_mode else LIGHT
+    def p(self) -> Palette:
+        return DARK_P if self.dark_mode else LIGHT_P
 
     # ──────────────────────────────────────────────────────────────────────────
     # Layout helpers
@@ -489,17 +716,39 @@ class SudokuApp:
             self.btn_rects[btn["id"]] = pygame.Rect(x, BTN_Y, btn_w, BTN_H)
             x += btn_w + gap
 
+    def _button_at(self, pos: tuple) -> str | None:
+        for btn in BUTTONS:
+            if self.btn_rects[btn["id"]].collidepoint(pos):
+                return btn["id"]
+        return None
+
     def _cell_rect(self, r: int, c: int) -> pygame.Rect:
         return pygame.Rect(GRID_X + c * CELL_SIZE, GRID_Y + r * CELL_SIZE,
                            CELL_SIZE, CELL_SIZE)
 
+    def _glyph(self, font: str, d: int, color: tuple) -> pygame.Surface:
+        key  = (font, d, color)
+        surf = self._glyph_cache.get(key)
+        if surf is None:
+            surf = self.fonts[font].render(str(d), True, color).convert_alpha()
+            self._glyph_cache[key] = surf
+        return surf
+
+    def _text(self, font: str, text: str, color: tuple) -> pygame.Surface:
+        key  = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= _TEXT_CACHE_MAX:
+                self._text_cache.clear()
+            surf = self.fonts[font].render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+
     def _is_peer_of_selected(self, r: int, c: int) -> bool:
         if self.selected is None:
             return False
         sr, sc = self.selected
-        if (r, c) == (sr, sc):
-            return False
-        return r == sr or c == sc or Grid.box_of(r, c) == Grid.box_of(sr, sc)
+        return bool((_PEER_MASK[sr * 9 + sc] >> (r * 9 + c)) & 1)
 
     # ──────────────────────────────────────────────────────────────────────────
     # Puzzle loading / step computation
@@ -511,72 +760,93 @@ class SudokuApp:
         self.compute_all_steps_async()
 
     def compute_all_steps_async(self):
-        """Run compute_all_steps in a background thread."""
+        """Compute all steps in a worker process, off the GIL of the draw loop."""
+        self._stop_compute()
+        self._stop_generate()   # a pending generated puzzle would replace this one
+        self._step_bodies.clear()
+        self._initial_givens = [[v != 0 for v in row] for row in self.initial_values]
+        self._initial_empty  = sum(row.count(0) for row in self.initial_values)
         self.steps        = []
+        self._elim_lines  = []
+        self._step_lines  = []
+        self._timeline_ticks = []
+        self._placed_by   = [-1] * 81
         self.grid_states  = []
         self.stuck        = False
         self.difficulty   = 0
         self._computing   = True
-        self._compute_ready = False
         self.brute_force_grid = None
         self.conflict_cells   = set()
-        self.highlight    = {}
-        self.elim_set     = set()
+        self.highlight    = bytearray(81)
+        self.elim_masks   = [0] * 81
         self.step_idx     = 0
         self.panel_scroll = 0
-        t = threading.Thread(target=self._compute_worker, daemon=True)
-        t.start()
-
-    def _compute_worker(self):
-        """Run in background thread: compute all steps, set flag when done."""
-        steps: list[Step] = []
-        stuck = False
-        grid_states: list[Grid] = []
-        conflict_cells: set = set()
-
-        init_conflicts = validate_board(self.initial_values)
-        if init_conflicts:
-            conflict_cells = init_conflicts
-            grid_states    = [Grid(self.initial_values)]
-            stuck          = True
-        else:
-            grid = Grid(self.initial_values)
-            grid_states = [deepcopy(grid)]
-            while not grid.is_solved():
-                step = None
-                for _, fn in ALL_STRATEGIES:
-                    step = fn(grid)
-                    if step:
-                        break
-                if step is None:
-                    stuck = True
-                    break
-                steps.append(step)
-                grid.apply_step(step)
-                conflicts = validate_board(grid.values)
-                if conflicts:
-                    conflict_cells = conflicts
-                    grid_states.append(deepcopy(grid))
-                    stuck = True
-                    break
-                grid_states.append(deepcopy(grid))
+        self._panel_stale = True
+        self._dirty       = True
+        # One long-lived worker serves every load, so process start-up (a
+        # full re-import under the spawn start method) is paid only once
+        if self._compute_proc is None or not self._compute_proc.is_alive():
+            self._close_compute_worker()
+            parent_conn, child_conn = multiprocessing.Pipe()
+            proc = multiprocessing.Process(target=_compute_worker,
+                                           args=(child_conn,), daemon=True)
+            proc.start()
+            child_conn.close()
+            self._compute_proc, self._compute_conn = proc, parent_conn
+        self._compute_conn.send(self.initial_values)   # type: ignore[union-attr]
+
+    def _stop_compute(self):
+        """Abandon any in-flight computation (e.g. a new puzzle was loaded).
+        A busy worker can't be interrupted mid-solve, so it is replaced."""
+        if self._computing:
+            self._close_compute_worker()
+
+    def _close_compute_worker(self):
+        if self._compute_proc is not None:
+            self._compute_conn.close()   # type: ignore[union-attr]
+            if self._compute_proc.is_alive():
+                # SIGKILL: a worker cancelled right after the fork may not
+                # have reset SDL's SIGTERM handler yet
+                self._compute_proc.kill()
+            self._compute_proc.join()
+            self._compute_proc = self._compute_conn = None
 
-        self.steps           = steps
-        self.grid_states     = grid_states
-        self.stuck           = stuck
-        self.conflict_cells  = conflict_cells
-        self.difficulty      = rate_puzzle(steps)
-        self._computing      = False
-        self._compute_ready  = True
+    def _check_compute_ready(self):
+        """Call from main loop; applies results when the worker process finishes."""
+        conn = self._compute_conn
+        if not self._computing or conn is None or not conn.poll():
+            return
+        try:
+            steps, packed, stuck, conflict_cells = conn.recv()
+        except EOFError:
+            # Worker died without a result; fall back to the initial grid
+            steps, packed, stuck, conflict_cells = (
+                [], b"".join(Grid(self.initial_values).snapshot()), True, set())
+            self._close_compute_worker()
+
+        self.steps          = steps
+        self._elim_lines    = [_elimination_lines(st) for st in steps]
+        self._step_lines    = [_step_line(i, st) for i, st in enumerate(steps, 1)]
+        total, every = len(steps), max(1, len(steps) // 9)
+        self._timeline_ticks = ([GRID_X + int(GRID_PX * i / total)
+                                 for i in range(every, total, every)]
+                                if total >= 9 else [])
+        self._placed_by     = [-1] * 81
+        for i, st in enumerate(steps):
+            for r, c, _ in st.placements:
+                if self._placed_by[r * 9 + c] < 0:
+                    self._placed_by[r * 9 + c] = i
+        self.grid_states    = [(packed[i:i + 81], packed[i + 81:i + _SNAP_SIZE])
+                               for i in range(0, len(packed), _SNAP_SIZE)]
+        self.stuck          = stuck
+        self.conflict_cells = conflict_cells
+        self.difficulty     = rate_puzzle(steps)
+        self._computing     = False
 
         msg = "STUCK" if stuck else "Solved!"
         print(f"Computed {len(steps)} steps. {msg} Difficulty: Tier {self.difficulty}")
-
-    def _check_compute_ready(self):
-        """Call from main loop; applies results when background thread finishes."""
-        if self._compute_ready:
-            self._compute_ready = False
-            self.go_to_step(0)
+        self._dirty = True
+        self.go_to_step(0)
 
     # ──────────────────────────────────────────────────────────────────────────
     # Navigation
@@ -586,19 +856,23 @@ class SudokuApp:
         self.brute_force_grid = None
         self.panel_scroll     = 0
         self.hint_level       = 0
+        self._panel_stale     = True
         self.step_idx = max(0, min(idx, len(self.steps)))
         if self.step_idx > 0:
             step = self.steps[self.step_idx - 1]
-            self.highlight = self._build_highlight(step)
-            self.elim_set  = {(r, c, d) for r, c, d in step.eliminations}
+            self.highlight  = self._build_highlight(step)
+            self.elim_masks = [0] * 81
+            for r, c, d in step.eliminations:
+                self.elim_masks[r * 9 + c] |= 1 << (d - 1)
         else:
-            self.highlight = {}
-            self.elim_set  = set()
+            self.highlight  = bytearray(81)
+            self.elim_masks = [0] * 81
         self.conflict_cells = validate_board(
-            self.grid_states[self.step_idx].values)
+            _snap_rows(self.grid_states[self.step_idx][0]))
 
-    def _build_highlight(self, step: Step) -> dict:
-        h: dict = {}
+    def _build_highlight(self, step: Step) -> bytearray:
+        # Tags rank house < pattern < elim < place; a cell keeps the highest
+        h = bytearray(81)
         if step.house_type and step.house_index >= 0:
             if step.house_type == "row":
                 cells = [(step.house_index, c) for c in range(9)]
@@ -606,16 +880,16 @@ class SudokuApp:
                 cells = [(r, step.house_index) for r in range(9)]
             else:
                 cells = Grid.cells_of_box(step.house_index)
-            for rc in cells:
-                h[rc] = "house"
-        for rc in step.pattern_cells:
-            if h.get(rc) in (None, "house"):
-                h[rc] = "pattern"
+            for r, c in cells:
+                h[r * 9 + c] = _HL_HOUSE
+        for r, c in step.pattern_cells:
+            if h[r * 9 + c] <= _HL_HOUSE:
+                h[r * 9 + c] = _HL_PATTERN
         for r, c, _d in step.eliminations:
-            if h.get((r, c)) in (None, "house", "pattern"):
-                h[(r, c)] = "elim"
+            if h[r * 9 + c] <= _HL_PATTERN:
+                h[r * 9 + c] = _HL_ELIM
         for r, c, _d in step.placements:
-            h[(r, c)] = "place"
+            h[r * 9 + c] = _HL_PLACE
         return h
 
     # ──────────────────────────────────────────────────────────────────────────
@@ -623,31 +897,93 @@ class SudokuApp:
     # ──────────────────────────────────────────────────────────────────────────
 
     def draw(self):
-        self.screen.fill(self.p["bg"])
+        # Dialogs run their own event loops, so hover may be stale after one
+        self._hovered_bid = self._button_at(pygame.mouse.get_pos())
+        self.screen.fill(self.p.bg)
         self.draw_grid()
         self.draw_panel()
         self.draw_timeline()
         self.draw_buttons()
-        if self._computing:
+        if self._computing or self._gen_proc is not None:
             self._draw_computing_overlay()
         pygame.display.flip()
+        self._dirty = False
+        self._dirty_rects.clear()
+
+    def draw_dirty(self):
+        """Repaint just the regions in _dirty_rects and push only those."""
+        rects = self._dirty_rects
+        if sum(r.w * r.h for r in rects) > WIN_W * WIN_H // 2:
+            self.draw()
+            return
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self.screen.fill(self.p.bg)
+            if rect.colliderect(GRID_AREA):
+                self.draw_grid()
+            if rect.colliderect(PANEL_AREA):
+                self.draw_panel()
+            if rect.colliderect(TIMELINE_AREA):
+                self.draw_timeline()
+            if rect.colliderect(BTN_AREA):
+                self.draw_buttons([bid for bid, r in self.btn_rects.items()
+                                   if r.colliderect(rect)])
+        self.screen.set_clip(None)
+        pygame.display.update(rects)
+        self._dirty_rects = []
 
     # ── Grid ──────────────────────────────────────────────────────────────────
 
     def draw_grid(self):
+        # Static layer first; draw_cell then only paints cells that differ
+        # from it, queueing glyphs so they go out in one blits() call (cells
+        # don't overlap), and the lines go back on top of whatever was repainted
+        self.screen.blit(self._grid_static(), (GRID_X - 2, GRID_Y - 2))
+        self._cell_blits = []
         for r in range(9):
             for c in range(9):
                 self.draw_cell(r, c)
-        for i in range(10):
-            thick = (i % 3 == 0)
-            color = self.p["grid_thick"] if thick else self.p["grid_thin"]
-            width = 2 if thick else 1
-            y = GRID_Y + i * CELL_SIZE
-            pygame.draw.line(self.screen, color,
-                             (GRID_X, y), (GRID_X + GRID_PX, y), width)
-            x = GRID_X + i * CELL_SIZE
-            pygame.draw.line(self.screen, color,
-                             (x, GRID_Y), (x, GRID_Y + GRID_PX), width)
+        self.screen.blits(self._cell_blits, doreturn=False)
+        self.screen.blit(self._grid_line_layer(), (GRID_X - 2, GRID_Y - 2))
+
+    def _grid_line_layer(self) -> pygame.Surface:
+        surf = self._grid_lines.get(self.dark_mode)
+        if surf is None:
+            size = GRID_PX + 4
+            surf = pygame.Surface((size, size)).convert()
+            surf.fill(_LINE_KEY)
+            for i in range(10):
+                thick = (i % 3 == 0)
+                color = self.p.grid_thick if thick else self.p.grid_thin
+                width = 2 if thick else 1
+                y = 2 + i * CELL_SIZE
+                pygame.draw.line(surf, color, (2, y), (2 + GRID_PX, y), width)
+                x = 2 + i * CELL_SIZE
+                pygame.draw.line(surf, color, (x, 2), (x, 2 + GRID_PX), width)
+            # RLE colorkey: the blit only touches the line pixels
+            surf.set_colorkey(_LINE_KEY, pygame.RLEACCEL)
+            self._grid_lines[self.dark_mode] = surf
+        return surf
+
+    def _grid_static(self) -> pygame.Surface:
+        """Plain cell backgrounds, given digits and grid lines for the loaded puzzle."""
+        givens = self.grid_states[0][0] if self.grid_states else bytes(81)
+        key = (self.dark_mode, givens)
+        if self._static_key != key:
+            p    = self.p
+            size = GRID_PX + 4
+            surf = pygame.Surface((size, size)).convert()
+            surf.fill(p.bg)
+            for i, v in enumerate(givens):
+                rect = pygame.Rect(2 + (i % 9) * CELL_SIZE, 2 + (i // 9) * CELL_SIZE,
+                                   CELL_SIZE, CELL_SIZE)
+                if v:
+                    pygame.draw.rect(surf, p.given_bg, rect)
+                    digit = self._glyph("digit", v, p.given_fg)
+                    surf.blit(digit, digit.get_rect(center=rect.center))
+            surf.blit(self._grid_line_layer(), (0, 0))
+            self._static_bg, self._static_key = surf, key
+        return self._static_bg   # type: ignore[return-value]
 
     def draw_cell(self, r: int, c: int):
         rect = self._cell_rect(r, c)
@@ -655,16 +991,17 @@ class SudokuApp:
 
         # ── Brute-force view ─────────────────────────────────────────────────
         if self.brute_force_grid is not None and self.mode == "solve":
-            last = self.grid_states[-1]
-            bf_v = self.brute_force_grid[r][c]
-            bg   = p["given_bg"] if last.givens[r][c] else p["bg"]
+            i     = r * 9 + c
+            given = self.grid_states[0][0][i] != 0
+            bf_v  = self.brute_force_grid[r][c]
+            bg    = p.given_bg if given else p.bg
             pygame.draw.rect(self.screen, bg, rect)
             if bf_v:
-                color = (p["given_fg"] if last.givens[r][c]
-                         else p["solved_fg"] if last.values[r][c] != 0
-                         else p["brute_fg"])
-                surf = self.fonts["digit"].render(str(bf_v), True, color)
-                self.screen.blit(surf, surf.get_rect(center=rect.center))
+                color = (p.given_fg if given
+                         else p.solved_fg if self.grid_states[-1][0][i] != 0
+                         else p.brute_fg)
+                surf = self._glyph("digit", bf_v, color)
+                self._cell_blits.append((surf, surf.get_rect(center=rect.center)))
             return
 
         # ── Play mode ─────────────────────────────────────────────────────────
@@ -676,186 +1013,169 @@ class SudokuApp:
         if self.mode in ("input", "create"):
             edit_vals = self.input_values if self.mode == "input" else self.create_values
             if (r, c) in self.conflict_cells:
-                bg = p["conflict_bg"]
+                bg = p.conflict_bg
             elif self.selected == (r, c):
-                bg = p["selected"]
+                bg = p.selected
             elif self._is_peer_of_selected(r, c):
-                bg = p["peer_bg"]
+                bg = p.peer_bg
             elif edit_vals[r][c] != 0:   # type: ignore[index]
-                bg = p["given_bg"]
+                bg = p.given_bg
             else:
-                bg = p["bg"]
+                bg = p.bg
         else:
             if not self.grid_states:
-                pygame.draw.rect(self.screen, p["bg"], rect)
+                pygame.draw.rect(self.screen, p.bg, rect)
                 return
-            grid = self.grid_states[self.step_idx]
+            values, cands = self.grid_states[self.step_idx]
+            i = r * 9 + c
             if (r, c) in self.conflict_cells:
-                bg = p["conflict_bg"]
+                bg = p.conflict_bg
             else:
-                tag = self.highlight.get((r, c))
-                if tag == "place":
-                    bg = p["place_bg"]
-                elif tag == "elim":
-                    bg = p["elim_bg"]
-                elif tag == "pattern":
-                    bg = p["pattern_bg"]
-                elif tag == "house":
-                    bg = p["house_bg"]
+                tag = self.highlight[i]
+                if tag == _HL_PLACE:
+                    bg = p.place_bg
+                elif tag == _HL_ELIM:
+                    bg = p.elim_bg
+                elif tag == _HL_PATTERN:
+                    bg = p.pattern_bg
+                elif tag == _HL_HOUSE:
+                    bg = p.house_bg
                 elif self.selected == (r, c):
-                    bg = p["selected"]
+                    bg = p.selected
                 elif self._is_peer_of_selected(r, c):
-                    bg = p["peer_bg"]
+                    bg = p.peer_bg
                 elif self.filter_digit and self.mode == "solve":
-                    has_d = (grid.values[r][c] == self.filter_digit
-                             or (grid.values[r][c] == 0
-                                 and self.filter_digit in grid.candidates[r][c]))
-                    bg = p["filter_hi"] if has_d else p["filter_dim"]
-                elif grid.givens[r][c]:
-                    bg = p["given_bg"]
+                    has_d = (values[i] == self.filter_digit
+                             or (values[i] == 0
+                                 and (_cand_bits(cands, i) >> (self.filter_digit - 1)) & 1))
+                    bg = p.filter_hi if has_d else p.filter_dim
+                elif self.grid_states[0][0][i]:
+                    bg = p.given_bg
                 else:
-                    bg = p["bg"]
+                    bg = p.bg
+            # Unhighlighted cells are already on the static layer; givens
+            # need nothing further, other cells just their content
+            if bg == (p.given_bg if self.grid_states[0][0][i] else p.bg):
+                if self.grid_states[0][0][i]:
+                    return
+                bg = None
 
-        pygame.draw.rect(self.screen, bg, rect)
+        if bg is not None:
+            pygame.draw.rect(self.screen, bg, rect)
 
         # ── Content ───────────────────────────────────────────────────────────
         if self.mode in ("input", "create"):
             edit_vals = self.input_values if self.mode == "input" else self.create_values
             v = edit_vals[r][c]   # type: ignore[index]
             if v:
-                surf = self.fonts["digit"].render(str(v), True, p["given_fg"])
-                self.screen.blit(surf, surf.get_rect(center=rect.center))
+                surf = self._glyph("digit", v, p.given_fg)
+                self._cell_blits.append((surf, surf.get_rect(center=rect.center)))
         else:
-            grid = self.grid_states[self.step_idx]
-            v = grid.values[r][c]
+            i = r * 9 + c
+            v = self.grid_states[self.step_idx][0][i]
             if v:
-                color = p["given_fg"] if grid.givens[r][c] else p["solved_fg"]
-                surf = self.fonts["digit"].render(str(v), True, color)
-                self.screen.blit(surf, surf.get_rect(center=rect.center))
+                color = p.given_fg if self.grid_states[0][0][i] else p.solved_fg
+                surf = self._glyph("digit", v, color)
+                self._cell_blits.append((surf, surf.get_rect(center=rect.center)))
             elif self.show_candidates:
-                self.draw_candidates(r, c, rect, grid)
+                self.draw_candidates(r, c, rect)
 
     def _draw_cell_play(self, r: int, c: int, rect: pygame.Rect):
         p = self.p
-        initial = Grid(self.initial_values)
-        is_given = initial.givens[r][c]
+        is_given = self._initial_givens[r][c]
         pv = self.play_values[r][c]        # type: ignore[index]
 
         if self.selected == (r, c):
-            bg = p["selected"]
+            bg = p.selected
         elif self._is_peer_of_selected(r, c):
-            bg = p["peer_bg"]
+            bg = p.peer_bg
         elif is_given:
-            bg = p["given_bg"]
+            bg = p.given_bg
         elif pv:
             sol = self.play_solution[r][c] if self.play_solution else None
-            bg = p["bg"]  # colored by correctness below
+            bg = p.bg  # colored by correctness below
         else:
-            bg = p["bg"]
+            bg = p.bg
         pygame.draw.rect(self.screen, bg, rect)
 
         # Mark-mode border on selected cell
         if self.play_cand_mode and self.selected == (r, c):
-            pygame.draw.rect(self.screen, p["accent"], rect, 3)
+            pygame.draw.rect(self.screen, p.accent, rect, 3)
 
         if pv:
             if is_given:
-                color = p["given_fg"]
+                color = p.given_fg
             elif self.play_solution and pv != self.play_solution[r][c]:
-                color = p["play_err"]
+                color = p.play_err
             else:
-                color = p["play_fg"]
-            surf = self.fonts["digit"].render(str(pv), True, color)
-            self.screen.blit(surf, surf.get_rect(center=rect.center))
+                color = p.play_fg
+            surf = self._glyph("digit", pv, color)
+            self._cell_blits.append((surf, surf.get_rect(center=rect.center)))
         elif self.show_candidates:
-            user_set  = self.play_user_cands.get((r, c))
-            cands     = user_set if user_set is not None else _bt_candidates(self.play_values, r, c)  # type: ignore[arg-type]
-            is_manual = user_set is not None
-            for d in range(1, 10):
-                if d in cands:
-                    dc = (d - 1) % 3
-                    dr = (d - 1) // 3
-                    cx = rect.x + dc * SUBCELL_W + SUBCELL_W // 2
-                    cy = rect.y + dr * SUBCELL_H + SUBCELL_H // 2
-                    color = p["accent"] if is_manual else p["cand_fg"]
-                    surf = self.fonts["cand"].render(str(d), True, color)
-                    self.screen.blit(surf, surf.get_rect(centerx=cx, centery=cy))
-
-    def draw_candidates(self, r: int, c: int, cell_rect: pygame.Rect,
-                        grid: Grid):
+            user_mask = self.play_user_cands.get((r, c))
+            cands     = user_mask if user_mask is not None else _bt_candidates(self.play_values, r, c)  # type: ignore[arg-type]
+            color     = p.accent if user_mask is not None else p.cand_fg
+            while cands:
+                bit = cands & -cands
+                cands ^= bit
+                d = bit.bit_length()
+                dx, dy = _CAND_CENTER[d - 1]
+                surf = self._glyph("cand", d, color)
+                self._cell_blits.append((surf, surf.get_rect(centerx=rect.x + dx,
+                                                             centery=rect.y + dy)))
+
+    def draw_candidates(self, r: int, c: int, cell_rect: pygame.Rect):
         p = self.p
-        current_cands = grid.candidates[r][c]
+        i = r * 9 + c
+        current_cands = _cand_bits(self.grid_states[self.step_idx][1], i)
         # Apply user pencilmark overrides (toggle XOR)
-        override = self.user_cands.get((r, c), set())
-        display_cands = current_cands.symmetric_difference(override)
+        override_bits = self.user_cands.get((r, c), 0)
+        display_cands = current_cands ^ override_bits
 
-        prev_cands: set = set()
+        prev_cands = 0
         if self.step_idx > 0:
-            prev_cands = self.grid_states[self.step_idx - 1].candidates[r][c]
-
-        for d in range(1, 10):
-            dr = (d - 1) // 3
-            dc = (d - 1) % 3
-            cx = cell_rect.x + dc * SUBCELL_W + SUBCELL_W // 2
-            cy = cell_rect.y + dr * SUBCELL_H + SUBCELL_H // 2
-
-            in_display  = d in display_cands
-            in_current  = d in current_cands
-            was_in_prev = d in prev_cands
-            is_elim     = (r, c, d) in self.elim_set
-            is_override = d in override
-
-            if in_display or (is_elim and was_in_prev):
-                color = (p["elim_cand"] if is_elim and was_in_prev and not in_current
-                         else (p["accent"] if is_override else p["cand_fg"]))
-                surf = self.fonts["cand"].render(str(d), True, color)
-                self.screen.blit(surf, surf.get_rect(centerx=cx, centery=cy))
+            prev_cands = _cand_bits(self.grid_states[self.step_idx - 1][1], i)
+        # Digits eliminated by this step are still shown (in elim_cand)
+        just_elim = self.elim_masks[i] & prev_cands
+
+        # Visit only the digits that will actually be drawn
+        draw_mask = display_cands | just_elim
+        while draw_mask:
+            bit = draw_mask & -draw_mask
+            draw_mask ^= bit
+            d = bit.bit_length()
+            dx, dy = _CAND_CENTER[d - 1]
+            color = (p.elim_cand if just_elim & bit and not current_cands & bit
+                     else (p.accent if override_bits & bit else p.cand_fg))
+            surf = self._glyph("cand", d, color)
+            self._cell_blits.append((surf, surf.get_rect(centerx=cell_rect.x + dx,
+                                                         centery=cell_rect.y + dy)))
 
     # ── Info panel ────────────────────────────────────────────────────────────
 
     def draw_panel(self):
         panel_view = pygame.Rect(PANEL_X, GRID_Y, PANEL_W, GRID_PX)
-        pygame.draw.rect(self.screen, self.p["panel_bg"], panel_view)
+        pygame.draw.rect(self.screen, self.p.panel_bg, panel_view)
 
-        psurf = pygame.Surface((PANEL_W, PANEL_SURF_H))
-        psurf.fill(self.p["panel_bg"])
-
-        x, y = 10, 10
-        max_w = PANEL_W - 20
-
-        # Title
-        tier_str = f"  Tier {self.difficulty}" if self.difficulty else ""
-        title = "SUDOKU TUTOR" + tier_str
-        surf = self.fonts["panel_title"].render(title, True, self.p["given_fg"])
-        psurf.blit(surf, (x, y))
-        y += surf.get_height() + 6
-        pygame.draw.line(psurf, self.p["panel_line"], (6, y), (PANEL_W-6, y), 1)
-        y += 8
-
-        if self.mode == "input":
-            y = self._panel_input(psurf, x, y, max_w)
-        elif self.mode == "play":
-            y = self._panel_play(psurf, x, y, max_w)
-        elif self.mode == "create":
-            y = self._panel_create(psurf, x, y, max_w)
-        else:
-            y = self._panel_solve(psurf, x, y, max_w)
+        if self._panel_stale or self._panel_surf is None:
+            self._rebuild_panel_surf()
+        psurf = self._panel_surf
 
         # Scroll clamping
-        content_h  = max(y + 10, GRID_PX)
+        content_h  = self._panel_content_h
         max_scroll = max(0, content_h - GRID_PX)
         self.panel_scroll = max(0, min(self.panel_scroll, max_scroll))
 
         viewport = pygame.Rect(0, self.panel_scroll, PANEL_W, GRID_PX)
         self.screen.blit(psurf, (PANEL_X, GRID_Y), viewport)
-        pygame.draw.rect(self.screen, self.p["grid_thin"], panel_view, 1)
+        pygame.draw.rect(self.screen, self.p.grid_thin, panel_view, 1)
 
         # Scrollbar
         if max_scroll > 0:
             bar_track = GRID_PX - 4
             bar_h = max(18, int(bar_track * GRID_PX / content_h))
             bar_y = GRID_Y + 2 + int((bar_track - bar_h) * self.panel_scroll / max_scroll)
-            pygame.draw.rect(self.screen, self.p["scrollbar"],
+            pygame.draw.rect(self.screen, self.p.scrollbar,
                              pygame.Rect(PANEL_X + PANEL_W - 5, bar_y, 3, bar_h),
                              border_radius=2)
 
@@ -863,17 +1183,53 @@ class SudokuApp:
         if self.hint_level > 0 and self.mode == "solve":
             self._draw_hint_overlay()
 
+    def _rebuild_panel_surf(self):
+        """Render the whole panel text for the current state into _panel_surf."""
+        if self._panel_surf is None:
+            self._panel_surf = pygame.Surface((PANEL_W, PANEL_SURF_H)).convert()
+        psurf = self._panel_surf
+        psurf.fill(self.p.panel_bg)
+
+        x, y = 10, 10
+        max_w = PANEL_W - 20
+
+        # Title
+        tier_str = f"  Tier {self.difficulty}" if self.difficulty else ""
+        title = "SUDOKU TUTOR" + tier_str
+        surf = self._text("panel_title", title, self.p.given_fg)
+        self._panel_blits = [(surf, (x, y))]
+        y += surf.get_height() + 6
+        pygame.draw.line(psurf, self.p.panel_line, (6, y), (PANEL_W-6, y), 1)
+        y += 8
+
+        if self.mode == "input":
+            y = self._panel_input(psurf, x, y, max_w)
+        elif self.mode == "play":
+            y = self._panel_play(psurf, x, y, max_w)
+        elif self.mode == "create":
+            y = self._panel_create(psurf, x, y, max_w)
+        else:
+            y = self._panel_solve(psurf, x, y, max_w)
+        # Text lines never overlap each other or the separator rules, so
+        # the _panel_* methods only queue them and they go out in one call
+        psurf.blits(self._panel_blits, doreturn=False)
+        self._panel_blits = []
+
+        self._panel_content_h = max(y + 10, GRID_PX)
+        self._panel_stale     = False
+
     def _panel_solve(self, s: pygame.Surface, x: int, y: int, max_w: int) -> int:
         p = self.p
+        blits = self._panel_blits
 
         if self._computing:
-            surf = self.fonts["panel_body"].render("Computing steps…", True, p["accent"])
-            s.blit(surf, (x, y))
+            surf = self._text("panel_body", "Computing steps…", p.accent)
+            blits.append((surf, (x, y)))
             return y + surf.get_height() + 4
 
         if self.brute_force_grid is not None:
-            surf = self.fonts["panel_title"].render("BRUTE FORCE", True, p["brute_fg"])
-            s.blit(surf, (x, y)); y += surf.get_height() + 6
+            surf = self._text("panel_title", "BRUTE FORCE", p.brute_fg)
+            blits.append((surf, (x, y))); y += surf.get_height() + 6
             iters = self.brute_force_iters
             for line in ("Puzzle solved by backtracking.", "",
                          "Purple digits = brute-forced.", "",
@@ -881,148 +1237,166 @@ class SudokuApp:
                          "Press PREV to return."):
                 if not line:
                     y += 4; continue
-                surf = self.fonts["panel_body"].render(line, True, p["solved_fg"])
-                s.blit(surf, (x, y)); y += surf.get_height() + 2
+                surf = self._text("panel_body", line, p.solved_fg)
+                blits.append((surf, (x, y))); y += surf.get_height() + 2
             return y
 
         total = len(self.steps)
         diff_label = f"  (Tier {self.difficulty})" if self.difficulty else ""
-        surf = self.fonts["panel_body"].render(
-            f"Step {self.step_idx} / {total}{diff_label}", True, p["solved_fg"])
-        s.blit(surf, (x, y)); y += surf.get_height() + 6
+        surf = self._text("panel_body",
+            f"Step {self.step_idx} / {total}{diff_label}", p.solved_fg)
+        blits.append((surf, (x, y))); y += surf.get_height() + 6
 
         if self.conflict_cells:
             n = len(self.conflict_cells)
-            surf = self.fonts["panel_body"].render(
-                f"CONFLICT: {n} cell(s) violate rules!", True, p["warn"])
-            s.blit(surf, (x, y)); y += surf.get_height() + 4
+            surf = self._text("panel_body",
+                f"CONFLICT: {n} cell(s) violate rules!", p.warn)
+            blits.append((surf, (x, y))); y += surf.get_height() + 4
             if self.step_idx == 0:
-                surf = self.fonts["panel_body"].render(
-                    "Fix the puzzle in INPUT mode.", True, p["cand_fg"])
-                s.blit(surf, (x, y)); y += surf.get_height() + 2
+                surf = self._text("panel_body",
+                    "Fix the puzzle in INPUT mode.", p.cand_fg)
+                blits.append((surf, (x, y))); y += surf.get_height() + 2
             return y
 
         if self.step_idx == 0:
             if self.stuck:
-                surf = self.fonts["panel_body"].render(
-                    "STUCK! No strategy found.", True, p["warn"])
-                s.blit(surf, (x, y)); y += surf.get_height() + 6
-                surf = self.fonts["panel_body"].render(
-                    "NEXT to try brute force.", True, p["cand_fg"])
-                s.blit(surf, (x, y)); y += surf.get_height() + 2
+                surf = self._text("panel_body",
+                    "STUCK! No strategy found.", p.warn)
+                blits.append((surf, (x, y))); y += surf.get_height() + 6
+                surf = self._text("panel_body",
+                    "NEXT to try brute force.", p.cand_fg)
+                blits.append((surf, (x, y))); y += surf.get_height() + 2
             else:
                 for line in ("Initial puzzle.", "", "SPACE/NEXT to advance.",
                              "C=candidates  D=dark  H=hint",
                              "1–9=digit filter  P=play mode"):
                     if not line:
                         y += 4; continue
-                    surf = self.fonts["panel_body"].render(line, True, p["cand_fg"])
-                    s.blit(surf, (x, y)); y += surf.get_height() + 2
+                    surf = self._text("panel_body", line, p.cand_fg)
+                    blits.append((surf, (x, y))); y += surf.get_height() + 2
             return y
 
         step = self.steps[self.step_idx - 1]
 
         if self.stuck and self.step_idx == total:
-            surf = self.fonts["panel_body"].render(
-                "STUCK! No further strategy.", True, p["warn"])
-            s.blit(surf, (x, y)); y += surf.get_height() + 2
-            surf = self.fonts["panel_body"].render(
-                "NEXT to try brute force.", True, p["cand_fg"])
-            s.blit(surf, (x, y)); y += surf.get_height() + 6
+            surf = self._text("panel_body",
+                "STUCK! No further strategy.", p.warn)
+            blits.append((surf, (x, y))); y += surf.get_height() + 2
+            surf = self._text("panel_body",
+                "NEXT to try brute force.", p.cand_fg)
+            blits.append((surf, (x, y))); y += surf.get_height() + 6
+
+        body = self._step_body(step, x, max_w)
+        blits.append((body, (0, y))); y += body.get_height()
+
+        # ── Full step list ─────────────────────────────────────────────────
+        y += 12
+        pygame.draw.line(s, p.panel_line, (6, y), (PANEL_W-6, y), 1)
+        y += 6
+        hdr = self._text("small", "ALL STEPS", p.cand_fg)
+        blits.append((hdr, (x, y))); y += hdr.get_height() + 4
+
+        for idx, line_text in enumerate(self._step_lines[:self.step_idx], 1):
+            color = p.selected if idx == self.step_idx else p.solved_fg
+            surf = self._text("small", line_text, color)
+            blits.append((surf, (x, y))); y += surf.get_height() + 1
+
+        return y
 
-        surf = self.fonts["panel_title"].render(step.strategy, True, p["strategy_fg"])
-        s.blit(surf, (x, y)); y += surf.get_height() + 2
+    def _step_body(self, step: Step, x: int, max_w: int) -> pygame.Surface:
+        """Strategy, placements, eliminations and explanation of the current
+        step, rendered once per (step, palette) so scrubbing back reuses it."""
+        key  = (self.step_idx, self.dark_mode)
+        surf = self._step_bodies.get(key)
+        if surf is not None:
+            self._step_bodies.move_to_end(key)
+            return surf
+
+        p = self.p
+        blits: list = []
+        y = 0
+
+        surf = self._text("panel_title", step.strategy, p.strategy_fg)
+        blits.append((surf, (x, y))); y += surf.get_height() + 2
 
         tier = STRATEGY_TIER.get(step.strategy, "?")
-        surf = self.fonts["panel_body"].render(f"Tier {tier}", True, p["cand_fg"])
-        s.blit(surf, (x, y)); y += surf.get_height() + 8
+        surf = self._text("panel_body", f"Tier {tier}", p.cand_fg)
+        blits.append((surf, (x, y))); y += surf.get_height() + 8
 
         if step.placements:
-            surf = self.fonts["panel_body"].render("Placed:", True, p["ok"])
-            s.blit(surf, (x, y)); y += surf.get_height() + 2
+            surf = self._text("panel_body", "Placed:", p.ok)
+            blits.append((surf, (x, y))); y += surf.get_height() + 2
             for r, c, d in step.placements:
-                surf = self.fonts["panel_body"].render(
-                    f"  R{r+1}C{c+1} = {d}", True, p["solved_fg"])
-                s.blit(surf, (x, y)); y += surf.get_height() + 1
+                surf = self._text("panel_body",
+                    f"  R{r+1}C{c+1} = {d}", p.solved_fg)
+                blits.append((surf, (x, y))); y += surf.get_height() + 1
 
         if step.eliminations:
             y += 4
-            surf = self.fonts["panel_body"].render("Eliminated:", True, p["accent"])
-            s.blit(surf, (x, y)); y += surf.get_height() + 2
-            by_cell: dict = {}
-            for r, c, d in step.eliminations:
-                by_cell.setdefault((r, c), []).append(d)
-            for (r, c), ds in by_cell.items():
-                txt = f"  R{r+1}C{c+1}: {{{','.join(str(d) for d in sorted(ds))}}}"
-                surf = self.fonts["panel_body"].render(txt, True, p["solved_fg"])
-                s.blit(surf, (x, y)); y += surf.get_height() + 1
+            surf = self._text("panel_body", "Eliminated:", p.accent)
+            blits.append((surf, (x, y))); y += surf.get_height() + 2
+            for txt in self._elim_lines[self.step_idx - 1]:
+                surf = self._text("panel_body", txt, p.solved_fg)
+                blits.append((surf, (x, y))); y += surf.get_height() + 1
 
         y += 8
-        pygame.draw.line(s, self.p["panel_line"], (6, y), (PANEL_W-6, y), 1)
+        rule_y = y
         y += 6
-        y = self._wrapped(s, step.explanation, x, y, max_w,
-                          self.fonts["panel_body"], p["solved_fg"])
-
-        # ── Full step list ─────────────────────────────────────────────────
-        y += 12
-        pygame.draw.line(s, p["panel_line"], (6, y), (PANEL_W-6, y), 1)
-        y += 6
-        hdr = self.fonts["small"].render("ALL STEPS", True, p["cand_fg"])
-        s.blit(hdr, (x, y)); y += hdr.get_height() + 4
-
-        for i, st in enumerate(self.steps[:self.step_idx]):
-            idx = i + 1
-            placements = ", ".join(f"R{r+1}C{c+1}={d}" for r, c, d in st.placements)
-            line_text = f"{idx:2}. {placements or '—'}  [{st.strategy}]"
-            color = p["selected"] if idx == self.step_idx else p["solved_fg"]
-            surf = self.fonts["small"].render(line_text, True, color)
-            s.blit(surf, (x, y)); y += surf.get_height() + 1
-
-        return y
+        y = self._wrapped(blits, step.explanation, x, y, max_w,
+                          self.fonts["panel_body"], p.solved_fg)
+
+        surf = pygame.Surface((PANEL_W, y)).convert()
+        surf.fill(p.panel_bg)
+        surf.blits(blits, doreturn=False)
+        pygame.draw.line(surf, p.panel_line, (6, rule_y), (PANEL_W-6, rule_y), 1)
+        self._step_bodies[key] = surf
+        if len(self._step_bodies) > _STEP_BODY_CACHE_MAX:
+            self._step_bodies.popitem(last=False)
+        return surf
 
     def _panel_input(self, s: pygame.Surface, x: int, y: int, max_w: int) -> int:
         p = self.p
-        surf = self.fonts["panel_body"].render("INPUT MODE", True, p["accent"])
-        s.blit(surf, (x, y)); y += surf.get_height() + 6
+        blits = self._panel_blits
+        surf = self._text("panel_body", "INPUT MODE", p.accent)
+        blits.append((surf, (x, y))); y += surf.get_height() + 6
 
         if self.conflict_cells:
             msg = f"  {len(self.conflict_cells)} conflict(s) — fix before solving"
-            surf = self.fonts["panel_body"].render(msg, True, p["warn"])
+            surf = self._text("panel_body", msg, p.warn)
         else:
-            surf = self.fonts["panel_body"].render("  Board is valid", True, p["ok"])
-        s.blit(surf, (x, y)); y += surf.get_height() + 10
-        pygame.draw.line(s, p["panel_line"], (6, y), (PANEL_W-6, y), 1); y += 8
+            surf = self._text("panel_body", "  Board is valid", p.ok)
+        blits.append((surf, (x, y))); y += surf.get_height() + 10
+        pygame.draw.line(s, p.panel_line, (6, y), (PANEL_W-6, y), 1); y += 8
 
         for text in ["1–9   set digit", "0/Del   clear",
                      "Arrows   move", "X   clear all",
                      "Ctrl+Z/Y   undo/redo",
                      "Enter   solve", "ESC   cancel"]:
-            surf = self.fonts["panel_body"].render(text, True, p["solved_fg"])
-            s.blit(surf, (x, y)); y += surf.get_height() + 3
+            surf = self._text("panel_body", text, p.solved_fg)
+            blits.append((surf, (x, y))); y += surf.get_height() + 3
         return y
 
     def _panel_play(self, s: pygame.Surface, x: int, y: int, max_w: int) -> int:
         p = self.p
-        surf = self.fonts["panel_title"].render("PLAY MODE", True, p["play_fg"])
-        s.blit(surf, (x, y)); y += surf.get_height() + 6
+        blits = self._panel_blits
+        surf = self._text("panel_title", "PLAY MODE", p.play_fg)
+        blits.append((surf, (x, y))); y += surf.get_height() + 6
 
         if self.play_values is not None:
-            filled  = sum(1 for r in range(9) for c in range(9)
-                          if self.play_values[r][c] != 0
-                          and not Grid(self.initial_values).givens[r][c])
-            total_e = sum(1 for r in range(9) for c in range(9)
-                          if not Grid(self.initial_values).givens[r][c])
-            surf = self.fonts["panel_body"].render(
-                f"Filled: {filled} / {total_e}", True, p["cand_fg"])
-            s.blit(surf, (x, y)); y += surf.get_height() + 8
+            # Givens can't be edited in play mode, so every cell that was
+            # empty and no longer is has been filled by the player
+            filled = self._initial_empty - sum(row.count(0) for row in self.play_values)
+            surf = self._text("panel_body",
+                f"Filled: {filled} / {self._initial_empty}", p.cand_fg)
+            blits.append((surf, (x, y))); y += surf.get_height() + 8
 
         # Mode indicator
         mode_label = "MARK MODE  (M to switch)" if self.play_cand_mode else "FILL MODE  (M to switch)"
-        mode_color = p["accent"] if self.play_cand_mode else p["play_fg"]
-        surf = self.fonts["panel_body"].render(mode_label, True, mode_color)
-        s.blit(surf, (x, y)); y += surf.get_height() + 6
+        mode_color = p.accent if self.play_cand_mode else p.play_fg
+        surf = self._text("panel_body", mode_label, mode_color)
+        blits.append((surf, (x, y))); y += surf.get_height() + 6
 
-        pygame.draw.line(s, p["panel_line"], (6, y), (PANEL_W-6, y), 1); y += 8
+        pygame.draw.line(s, p.panel_line, (6, y), (PANEL_W-6, y), 1); y += 8
         cands_label = "C   hide candidates" if self.show_candidates else "C   show candidates"
         digit_label = "1–9   toggle pencilmark" if self.play_cand_mode else "1–9   fill digit"
         erase_label = "0/Del   clear marks" if self.play_cand_mode else "0/Del   erase"
@@ -1031,21 +1405,21 @@ class SudokuApp:
                      cands_label,
                      "K   clear all user marks",
                      "ESC   exit play mode"]:
-            surf = self.fonts["panel_body"].render(text, True, p["solved_fg"])
-            s.blit(surf, (x, y)); y += surf.get_height() + 3
+            surf = self._text("panel_body", text, p.solved_fg)
+            blits.append((surf, (x, y))); y += surf.get_height() + 3
 
         if self.hint_level > 0:
             y += 6
-            pygame.draw.line(s, p["panel_line"], (6, y), (PANEL_W-6, y), 1); y += 6
-            surf = self.fonts["panel_body"].render(
-                f"Hint level {self.hint_level}/4:", True, p["accent"])
-            s.blit(surf, (x, y)); y += surf.get_height() + 4
+            pygame.draw.line(s, p.panel_line, (6, y), (PANEL_W-6, y), 1); y += 6
+            surf = self._text("panel_body",
+                f"Hint level {self.hint_level}/4:", p.accent)
+            blits.append((surf, (x, y))); y += surf.get_height() + 4
             step = self._hint_step()
             if step:
                 hints = self._hint_texts(step)
                 for txt in hints[:self.hint_level]:
-                    y = self._wrapped(s, txt, x, y, max_w,
-                                      self.fonts["panel_body"], p["solved_fg"])
+                    y = self._wrapped(blits, txt, x, y, max_w,
+                                      self.fonts["panel_body"], p.solved_fg)
                     y += 2
         return y
 
@@ -1065,29 +1439,36 @@ class SudokuApp:
         box_w = PANEL_W - 12
         box_h = 110
 
-        pygame.draw.rect(self.screen, p["hint_bg"],
+        pygame.draw.rect(self.screen, p.hint_bg,
                          pygame.Rect(box_x, box_y, box_w, box_h), border_radius=5)
-        pygame.draw.rect(self.screen, p["accent"],
+        pygame.draw.rect(self.screen, p.accent,
                          pygame.Rect(box_x, box_y, box_w, box_h), 1, border_radius=5)
 
-        surf = self.fonts["small"].render(
-            f"Hint {self.hint_level}/4 (H=more)", True, p["accent"])
-        self.screen.blit(surf, (box_x + 6, box_y + 5))
+        surf = self._text("small",
+            f"Hint {self.hint_level}/4 (H=more)", p.accent)
+        blits = [(surf, (box_x + 6, box_y + 5))]
         y = box_y + 20
         for txt in lines:
-            y = self._wrapped(self.screen, txt, box_x + 6, y,
-                              box_w - 12, self.fonts["small"], p["solved_fg"])
+            y = self._wrapped(blits, txt, box_x + 6, y,
+                              box_w - 12, self.fonts["small"], p.solved_fg)
             y += 2
+        self.screen.blits(blits, doreturn=False)
 
     def _draw_computing_overlay(self):
-        """Dimmed overlay with 'Computing…' while background thread runs."""
+        """Dimmed overlay with 'Computing…' or 'Generating…' while a worker
+        process runs."""
         p = self.p
-        dim = pygame.Surface((GRID_PX, GRID_PX), pygame.SRCALPHA)
-        dim.fill((0, 0, 0, 80))
-        self.screen.blit(dim, (GRID_X, GRID_Y))
-        surf = self.fonts["panel_title"].render("Computing…", True, p["btn_text"])
+        if self._compute_dim is None:
+            # Opaque black with surface alpha: same blend as a per-pixel
+            # (0, 0, 0, 80) fill, without the per-pixel alpha path
+            self._compute_dim = pygame.Surface((GRID_PX, GRID_PX)).convert()
+            self._compute_dim.fill((0, 0, 0))
+            self._compute_dim.set_alpha(80)
+        self.screen.blit(self._compute_dim, (GRID_X, GRID_Y))
+        label = "Generating…" if self._gen_proc is not None else "Computing…"
+        surf = self._text("panel_title", label, p.btn_text)
         r = surf.get_rect(center=(GRID_X + GRID_PX//2, GRID_Y + GRID_PX//2))
-        pygame.draw.rect(self.screen, p["btn"],
+        pygame.draw.rect(self.screen, p.btn,
                          r.inflate(20, 12), border_radius=6)
         self.screen.blit(surf, r)
 
@@ -1097,36 +1478,46 @@ class SudokuApp:
         p = self.p
         total = len(self.steps)
         rect  = pygame.Rect(GRID_X, TIMELINE_Y, GRID_PX, TIMELINE_H)
-        pygame.draw.rect(self.screen, p["timeline_bg"], rect, border_radius=4)
+        pygame.draw.rect(self.screen, p.timeline_bg, rect, border_radius=4)
 
         if total > 0:
             fill_w = int(GRID_PX * self.step_idx / total)
             if fill_w > 0:
-                pygame.draw.rect(self.screen, p["timeline_fg"],
+                pygame.draw.rect(self.screen, p.timeline_fg,
                                  pygame.Rect(GRID_X, TIMELINE_Y, fill_w, TIMELINE_H),
                                  border_radius=4)
             # Thumb
             tx = GRID_X + fill_w
             thumb = pygame.Rect(tx - 4, TIMELINE_Y - 1, 8, TIMELINE_H + 2)
-            pygame.draw.rect(self.screen, p["grid_thick"], thumb, border_radius=3)
+            pygame.draw.rect(self.screen, p.grid_thick, thumb, border_radius=3)
 
         # Tick marks at box boundaries (every 3 steps if total >= 27, else just quarters)
-        if total >= 9:
-            for i in range(1, total):
-                x = GRID_X + int(GRID_PX * i / total)
-                if i % max(1, total // 9) == 0:
-                    pygame.draw.line(self.screen, p["grid_thin"],
-                                     (x, TIMELINE_Y), (x, TIMELINE_Y + TIMELINE_H), 1)
+        for x in self._timeline_ticks:
+            pygame.draw.line(self.screen, p.grid_thin,
+                             (x, TIMELINE_Y), (x, TIMELINE_Y + TIMELINE_H), 1)
 
     # ── Button bar ────────────────────────────────────────────────────────────
 
-    def draw_buttons(self):
+    def _button_labels(self) -> dict[str, tuple]:
+        labels = self._btn_labels.get(self.dark_mode)
+        if labels is None:
+            labels = {}
+            for btn in BUTTONS:
+                surf = self.fonts["btn"].render(btn["label"], True, self.p.btn_text).convert_alpha()
+                labels[btn["id"]] = (surf, surf.get_rect(center=self.btn_rects[btn["id"]].center))
+            self._btn_labels[self.dark_mode] = labels
+        return labels
+
+    def draw_buttons(self, only: list[str] | None = None):
+        """Draw the button bar, or just the buttons listed in only."""
         p = self.p
-        mouse_pos = pygame.mouse.get_pos()
+        labels = self._button_labels()
         for btn in BUTTONS:
             bid   = btn["id"]
+            if only is not None and bid not in only:
+                continue
             rect  = self.btn_rects[bid]
-            hover = rect.collidepoint(mouse_pos)
+            hover = bid == self._hovered_bid
 
             is_on = ((bid == "auto"   and self.auto_play) or
                      (bid == "cands"  and self.show_candidates) or
@@ -1135,18 +1526,16 @@ class SudokuApp:
                      (bid == "create" and self.mode == "create"))
 
             if is_on:
-                bg = p["btn_on_hov"] if hover else p["btn_on"]
+                bg = p.btn_on_hov if hover else p.btn_on
             else:
-                bg = p["btn_hover"] if hover else p["btn"]
+                bg = p.btn_hover if hover else p.btn
 
             pygame.draw.rect(self.screen, bg, rect, border_radius=4)
-            surf = self.fonts["btn"].render(btn["label"], True, p["btn_text"])
-            self.screen.blit(surf, surf.get_rect(center=rect.center))
+            self.screen.blit(*labels[bid])
 
         # Filter digit indicator
-        if self.filter_digit:
-            surf = self.fonts["small"].render(
-                f"Filter: {self.filter_digit}", True, self.p["accent"])
+        if only is None and self.filter_digit:
+            surf = self._text("small", f"Filter: {self.filter_digit}", p.accent)
             self.screen.blit(surf, (PANEL_X, BTN_Y + BTN_H + 2))
 
     # ──────────────────────────────────────────────────────────────────────────
@@ -1154,7 +1543,26 @@ class SudokuApp:
     # ──────────────────────────────────────────────────────────────────────────
 
     def handle_events(self) -> bool:
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if not events and not (self._dirty or self.auto_play or self._computing):
+            # Nothing to animate: sleep until input instead of busy-polling
+            event = pygame.event.wait(16)
+            if event.type != pygame.NOEVENT:
+                events = [event]
+        for event in events:
+            # Mouse motion can only change button hover and the wheel only
+            # scrolls the panel; anything else may change the whole screen
+            if event.type == pygame.MOUSEMOTION:
+                bid = self._button_at(event.pos)
+                if bid != self._hovered_bid:
+                    for b in (self._hovered_bid, bid):
+                        if b is not None:
+                            self._dirty_rects.append(self.btn_rects[b])
+                    self._hovered_bid = bid
+                continue
+            if event.type != pygame.MOUSEWHEEL:
+                self._dirty = True
+                self._panel_stale = True
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.KEYDOWN:
@@ -1169,6 +1577,7 @@ class SudokuApp:
                 mx, my = pygame.mouse.get_pos()
                 if PANEL_X <= mx < PANEL_X + PANEL_W and GRID_Y <= my < GRID_Y + GRID_PX:
                     self.panel_scroll = max(0, self.panel_scroll - event.y * 20)
+                    self._dirty_rects.append(PANEL_AREA)
             elif event.type == pygame.DROPFILE:
                 self._handle_dropped_file(event.file)
         return True
@@ -1182,6 +1591,7 @@ class SudokuApp:
             return False
         if event.key == pygame.K_d and self.mode == "solve":
             self.dark_mode = not self.dark_mode
+            self._text_cache.clear()
             return True
         if event.key == pygame.K_v and (mods & (pygame.KMOD_CTRL | pygame.KMOD_META)):
             self._paste_from_clipboard()
@@ -1223,11 +1633,9 @@ class SudokuApp:
             self._advance_hint()
         elif ctrl and k == pygame.K_e:
             self._export_png()
-        elif k == pygame.K_0:
-            self.filter_digit = 0
-        elif event.unicode.isdigit() and event.unicode != "0":
-            d = int(event.unicode)
-            self.filter_digit = d if self.filter_digit != d else 0
+        elif k in _DIGIT_KEYS:
+            d = _DIGIT_KEYS[k]
+            self.filter_digit = d if d and self.filter_digit != d else 0
         return True
 
     def _key_input(self, event, ctrl: bool) -> bool:
@@ -1248,36 +1656,24 @@ class SudokuApp:
                 r, c = self.selected
                 self.input_values[r][c] = 0   # type: ignore[index]
                 self._update_input_conflicts()
-        elif event.unicode == "0":
+        elif _DIGIT_KEYS.get(k) == 0:
             if self.selected:
                 self._input_push_history()
                 r, c = self.selected
                 self.input_values[r][c] = 0   # type: ignore[index]
                 self._update_input_conflicts()
-                nc = c + 1 if c < 8 else 0
-                nr = r + (1 if c == 8 and r < 8 else 0)
-                self.selected = (nr, nc)
-        elif event.unicode.isdigit() and event.unicode != "0":
+                self.selected = _NEXT_CELL[r * 9 + c]
+        elif k in _DIGIT_KEYS:
             if self.selected:
                 self._input_push_history()
                 r, c = self.selected
-                self.input_values[r][c] = int(event.unicode)  # type: ignore[index]
+                self.input_values[r][c] = _DIGIT_KEYS[k]  # type: ignore[index]
                 self._update_input_conflicts()
-                nc = c + 1 if c < 8 else 0
-                nr = r + (1 if c == 8 and r < 8 else 0)
-                self.selected = (nr, nc)
-        elif k == pygame.K_UP:
+                self.selected = _NEXT_CELL[r * 9 + c]
+        elif k in _ARROW_DELTAS:
             if self.selected:
-                self.selected = (max(0, self.selected[0]-1), self.selected[1])
-        elif k == pygame.K_DOWN:
-            if self.selected:
-                self.selected = (min(8, self.selected[0]+1), self.selected[1])
-        elif k == pygame.K_LEFT:
-            if self.selected:
-                self.selected = (self.selected[0], max(0, self.selected[1]-1))
-        elif k == pygame.K_RIGHT:
-            if self.selected:
-                self.selected = (self.selected[0], min(8, self.selected[1]+1))
+                (r, c), (dr, dc) = self.selected, _ARROW_DELTAS[k]
+                self.selected = (min(8, max(0, r + dr)), min(8, max(0, c + dc)))
         return True
 
     def _key_play(self, event) -> bool:
@@ -1293,50 +1689,36 @@ class SudokuApp:
         elif k == pygame.K_k:
             # K = clear all user candidates (revert everything to auto)
             self.play_user_cands.clear()
-        elif k in (pygame.K_DELETE, pygame.K_BACKSPACE) or event.unicode == "0":
+        elif k in (pygame.K_DELETE, pygame.K_BACKSPACE) or _DIGIT_KEYS.get(k) == 0:
             if self.selected:
                 r, c = self.selected
-                initial = Grid(self.initial_values)
-                if not initial.givens[r][c]:
+                if not self._initial_givens[r][c]:
                     if self.play_cand_mode:
                         # clear user candidates for this cell → revert to auto
                         self.play_user_cands.pop((r, c), None)
                     else:
-                        self.play_values[r][c] = 0   # type: ignore[index]
-        elif event.unicode.isdigit() and event.unicode != "0":
+                        self._set_play_value(r, c, 0)
+        elif k in _DIGIT_KEYS:
             if self.selected:
                 r, c = self.selected
-                initial = Grid(self.initial_values)
-                if not initial.givens[r][c]:
+                if not self._initial_givens[r][c]:
                     if self.play_cand_mode:
                         # toggle pencilmark candidate
-                        d = int(event.unicode)
-                        cell_cands = self.play_user_cands.setdefault((r, c), set())
-                        if d in cell_cands:
-                            cell_cands.discard(d)
+                        d = _DIGIT_KEYS[k]
+                        cell_cands = self.play_user_cands.get((r, c), 0) ^ (1 << (d - 1))
+                        if cell_cands:
+                            self.play_user_cands[(r, c)] = cell_cands
                         else:
-                            cell_cands.add(d)
-                        if not cell_cands:
                             del self.play_user_cands[(r, c)]
                     else:
-                        self.play_values[r][c] = int(event.unicode)  # type: ignore[index]
+                        self._set_play_value(r, c, _DIGIT_KEYS[k])
                         self.play_user_cands.pop((r, c), None)  # clear marks when filling
                         self._check_play_complete()
-                        nc = c + 1 if c < 8 else 0
-                        nr = r + (1 if c == 8 and r < 8 else 0)
-                        self.selected = (nr, nc)
-        elif k == pygame.K_UP:
-            if self.selected:
-                self.selected = (max(0, self.selected[0]-1), self.selected[1])
-        elif k == pygame.K_DOWN:
-            if self.selected:
-                self.selected = (min(8, self.selected[0]+1), self.selected[1])
-        elif k == pygame.K_LEFT:
-            if self.selected:
-                self.selected = (self.selected[0], max(0, self.selected[1]-1))
-        elif k == pygame.K_RIGHT:
+                        self.selected = _NEXT_CELL[r * 9 + c]
+        elif k in _ARROW_DELTAS:
             if self.selected:
-                self.selected = (self.selected[0], min(8, self.selected[1]+1))
+                (r, c), (dr, dc) = self.selected, _ARROW_DELTAS[k]
+                self.selected = (min(8, max(0, r + dr)), min(8, max(0, c + dc)))
         return True
 
     def _key_create(self, event, ctrl: bool) -> bool:
@@ -1360,44 +1742,32 @@ class SudokuApp:
                 r, c = self.selected
                 self.create_values[r][c] = 0   # type: ignore[index]
                 self._update_create_conflicts()
-        elif event.unicode == "0":
+        elif _DIGIT_KEYS.get(k) == 0:
             if self.selected:
                 self._create_push_history()
                 r, c = self.selected
                 self.create_values[r][c] = 0   # type: ignore[index]
                 self._update_create_conflicts()
-                nc = c + 1 if c < 8 else 0
-                nr = r + (1 if c == 8 and r < 8 else 0)
-                self.selected = (nr, nc)
-        elif event.unicode.isdigit() and event.unicode != "0":
+                self.selected = _NEXT_CELL[r * 9 + c]
+        elif k in _DIGIT_KEYS:
             if self.selected:
                 self._create_push_history()
                 r, c = self.selected
-                self.create_values[r][c] = int(event.unicode)  # type: ignore[index]
+                self.create_values[r][c] = _DIGIT_KEYS[k]  # type: ignore[index]
                 self._update_create_conflicts()
-                nc = c + 1 if c < 8 else 0
-                nr = r + (1 if c == 8 and r < 8 else 0)
-                self.selected = (nr, nc)
-        elif k == pygame.K_UP:
+                self.selected = _NEXT_CELL[r * 9 + c]
+        elif k in _ARROW_DELTAS:
             if self.selected:
-                self.selected = (max(0, self.selected[0]-1), self.selected[1])
-        elif k == pygame.K_DOWN:
-            if self.selected:
-                self.selected = (min(8, self.selected[0]+1), self.selected[1])
-        elif k == pygame.K_LEFT:
-            if self.selected:
-                self.selected = (self.selected[0], max(0, self.selected[1]-1))
-        elif k == pygame.K_RIGHT:
-            if self.selected:
-                self.selected = (self.selected[0], min(8, self.selected[1]+1))
+                (r, c), (dr, dc) = self.selected, _ARROW_DELTAS[k]
+                self.selected = (min(8, max(0, r + dr)), min(8, max(0, c + dc)))
         return True
 
     def handle_click(self, pos: tuple):
         # Button bar
-        for btn in BUTTONS:
-            if self.btn_rects[btn["id"]].collidepoint(pos):
-                self._handle_button(btn["id"])
-                return
+        bid = self._button_at(pos)
+        if bid is not None:
+            self._handle_button(bid)
+            return
         # Timeline
         tl = pygame.Rect(GRID_X, TIMELINE_Y, GRID_PX, TIMELINE_H + 4)
         if tl.collidepoint(pos) and len(self.steps) > 0:
@@ -1421,19 +1791,16 @@ class SudokuApp:
         r, c = gy // CELL_SIZE, gx // CELL_SIZE
         if not self.grid_states:
             return
-        grid = self.grid_states[self.step_idx]
-        if grid.values[r][c] != 0:
+        if self.grid_states[self.step_idx][0][r * 9 + c] != 0:
             return   # cell already has a value
         self.selected = (r, c)
         # Prompt via digit filter indicator
         d = self.filter_digit
         if d:
-            ov = self.user_cands.setdefault((r, c), set())
-            if d in ov:
-                ov.discard(d)
+            ov = self.user_cands.get((r, c), 0) ^ (1 << (d - 1))
+            if ov:
+                self.user_cands[(r, c)] = ov
             else:
-                ov.add(d)
-            if not ov:
                 del self.user_cands[(r, c)]
 
     def _handle_button(self, bid: str):
@@ -1482,6 +1849,7 @@ class SudokuApp:
     # ──────────────────────────────────────────────────────────────────────────
 
     def enter_input_mode(self):
+        self._stop_generate()
         self.mode         = "input"
         self.input_values = [row[:] for row in self.initial_values]
         self.input_history = []
@@ -1507,7 +1875,7 @@ class SudokuApp:
             self.selected      = None
             self.input_values  = None
             self.conflict_cells = validate_board(
-                self.grid_states[self.step_idx].values)
+                _snap_rows(self.grid_states[self.step_idx][0]))
 
     def _clear_all_input(self):
         if self.input_values is not None:
@@ -1550,6 +1918,7 @@ class SudokuApp:
     # ──────────────────────────────────────────────────────────────────────────
 
     def enter_create_mode(self):
+        self._stop_generate()
         self.mode           = "create"
         self.create_values  = [[0]*9 for _ in range(9)]
         self.create_history = []
@@ -1582,7 +1951,7 @@ class SudokuApp:
             self.mode           = "solve"
             self.selected       = None
             self.conflict_cells = validate_board(
-                self.grid_states[self.step_idx].values)
+                _snap_rows(self.grid_states[self.step_idx][0]))
 
     def _create_clear_all(self):
         self._create_push_history()
@@ -1640,79 +2009,97 @@ class SudokuApp:
         solve_r  = pygame.Rect(bx + btn_w + gap,    by, btn_w, btn_h)
         cancel_r = pygame.Rect(bx + (btn_w + gap)*2, by, btn_w, btn_h)
 
-        while True:
-            self.clock.tick(30)
-            for ev in pygame.event.get():
-                if ev.type == pygame.QUIT:
-                    return None
-                elif ev.type == pygame.KEYDOWN:
-                    if ev.key == pygame.K_ESCAPE:
-                        return None
-                    elif ev.key == pygame.K_p:
-                        return "play"
-                    elif ev.key == pygame.K_s:
-                        return "solve"
-                elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
-                    if play_r.collidepoint(ev.pos):
-                        return "play"
-                    if solve_r.collidepoint(ev.pos):
-                        return "solve"
-                    if cancel_r.collidepoint(ev.pos):
+        # Nothing animates here: sleep until input and repaint only when an
+        # event or a hover change can have altered the dialog
+        hovered: pygame.Rect | None = None
+        redraw = True
+        try:
+            while True:
+                mouse = pygame.mouse.get_pos()
+                hover = next((r for r in (play_r, solve_r, cancel_r)
+                              if r.collidepoint(mouse)), None)
+                if hover is not hovered:
+                    hovered = hover
+                    redraw  = True
+
+                if redraw:
+                    p = self.p
+                    self.screen.blit(background, (0, 0))
+                    box = pygame.Rect(dx, dy, DW, DH)
+                    pygame.draw.rect(self.screen, p.panel_bg, box, border_radius=6)
+                    pygame.draw.rect(self.screen, p.grid_thick, box, 2, border_radius=6)
+
+                    surf = self._text("panel_title",
+                                      "Puzzle ready — what next?", p.given_fg)
+                    self.screen.blit(surf, (dx + 14, dy + 12))
+                    surf = self._text("panel_body",
+                                      "P = Play it yourself    S = Let computer solve",
+                                      p.cand_fg)
+                    self.screen.blit(surf, (dx + 14, dy + 40))
+
+                    for rect, label, base in (
+                        (play_r,   "PLAY  (P)",   p.btn_on),
+                        (solve_r,  "SOLVE  (S)",  p.btn),
+                        (cancel_r, "CANCEL",      p.btn),
+                    ):
+                        r, g, b = base
+                        bg = (min(r+20,255), min(g+20,255), min(b+20,255)) \
+                             if rect is hovered else base
+                        pygame.draw.rect(self.screen, bg, rect, border_radius=4)
+                        s = self._text("btn", label, p.btn_text)
+                        self.screen.blit(s, s.get_rect(center=rect.center))
+
+                    pygame.display.flip()
+                    redraw = False
+
+                for ev in [pygame.event.wait()] + pygame.event.get():
+                    if ev.type == pygame.QUIT:
                         return None
-
-            p = self.p
-            self.screen.blit(background, (0, 0))
-            box = pygame.Rect(dx, dy, DW, DH)
-            pygame.draw.rect(self.screen, p["panel_bg"], box, border_radius=6)
-            pygame.draw.rect(self.screen, p["grid_thick"], box, 2, border_radius=6)
-
-            surf = self.fonts["panel_title"].render(
-                "Puzzle ready — what next?", True, p["given_fg"])
-            self.screen.blit(surf, (dx + 14, dy + 12))
-            surf = self.fonts["panel_body"].render(
-                "P = Play it yourself    S = Let computer solve", True, p["cand_fg"])
-            self.screen.blit(surf, (dx + 14, dy + 40))
-
-            mouse = pygame.mouse.get_pos()
-            for rect, label, base in (
-                (play_r,   "PLAY  (P)",   p["btn_on"]),
-                (solve_r,  "SOLVE  (S)",  p["btn"]),
-                (cancel_r, "CANCEL",      p["btn"]),
-            ):
-                r, g, b = base
-                bg = (min(r+20,255), min(g+20,255), min(b+20,255)) \
-                     if rect.collidepoint(mouse) else base
-                pygame.draw.rect(self.screen, bg, rect, border_radius=4)
-                s = self.fonts["btn"].render(label, True, p["btn_text"])
-                self.screen.blit(s, s.get_rect(center=rect.center))
-
-            pygame.display.flip()
+                    elif ev.type == pygame.KEYDOWN:
+                        if ev.key == pygame.K_ESCAPE:
+                            return None
+                        elif ev.key == pygame.K_p:
+                            return "play"
+                        elif ev.key == pygame.K_s:
+                            return "solve"
+                    elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
+                        if play_r.collidepoint(ev.pos):
+                            return "play"
+                        if solve_r.collidepoint(ev.pos):
+                            return "solve"
+                        if cancel_r.collidepoint(ev.pos):
+                            return None
+                    if ev.type != pygame.MOUSEMOTION:
+                        redraw = True
+        finally:
+            self.clock.tick()   # don't count time spent here as a frame
 
     def _panel_create(self, s: pygame.Surface, x: int, y: int, max_w: int) -> int:
         p = self.p
-        surf = self.fonts["panel_body"].render("CREATE MODE", True, p["accent"])
-        s.blit(surf, (x, y)); y += surf.get_height() + 6
+        blits = self._panel_blits
+        surf = self._text("panel_body", "CREATE MODE", p.accent)
+        blits.append((surf, (x, y))); y += surf.get_height() + 6
 
         filled = sum(1 for r in range(9) for c in range(9)
                      if self.create_values and self.create_values[r][c] != 0)
-        surf = self.fonts["panel_body"].render(
-            f"  Digits placed: {filled}", True, p["cand_fg"])
-        s.blit(surf, (x, y)); y += surf.get_height() + 4
+        surf = self._text("panel_body",
+            f"  Digits placed: {filled}", p.cand_fg)
+        blits.append((surf, (x, y))); y += surf.get_height() + 4
 
         if self.conflict_cells:
             msg = f"  {len(self.conflict_cells)} conflict(s) — fix before continuing"
-            surf = self.fonts["panel_body"].render(msg, True, p["warn"])
+            surf = self._text("panel_body", msg, p.warn)
         else:
-            surf = self.fonts["panel_body"].render("  Board is valid", True, p["ok"])
-        s.blit(surf, (x, y)); y += surf.get_height() + 10
-        pygame.draw.line(s, p["panel_line"], (6, y), (PANEL_W-6, y), 1); y += 8
+            surf = self._text("panel_body", "  Board is valid", p.ok)
+        blits.append((surf, (x, y))); y += surf.get_height() + 10
+        pygame.draw.line(s, p.panel_line, (6, y), (PANEL_W-6, y), 1); y += 8
 
         for text in ["1–9   place digit", "0/Del   clear cell",
                      "Arrows   move", "X   clear all",
                      "Ctrl+Z/Y   undo/redo",
                      "Enter   Play or Solve", "ESC   cancel"]:
-            surf = self.fonts["panel_body"].render(text, True, p["solved_fg"])
-            s.blit(surf, (x, y)); y += surf.get_height() + 3
+            surf = self._text("panel_body", text, p.solved_fg)
+            blits.append((surf, (x, y))); y += surf.get_height() + 3
         return y
 
     # ──────────────────────────────────────────────────────────────────────────
@@ -1722,6 +2109,7 @@ class SudokuApp:
     def enter_play_mode(self):
         if self._computing:
             return
+        self._stop_generate()
         self.mode            = "play"
         self.auto_play       = False
         self.selected        = (0, 0)
@@ -1729,9 +2117,11 @@ class SudokuApp:
         self.play_values     = [row[:] for row in self.initial_values]
         self.play_user_cands = {}
         self.play_cand_mode  = False
+        self._next_hint_idx  = 0
+        self._refresh_next_hint()
         # Compute solution for validation
-        sol = _bt_solve([row[:] for row in self.initial_values])
-        self.play_solution = sol
+        self.play_solution, _ = self._bt_solve_cached(self.initial_values)
+        self._play_wrong = self._initial_empty
 
     def exit_play_mode(self):
         self.mode            = "solve"
@@ -1742,11 +2132,18 @@ class SudokuApp:
         self.play_user_cands = {}
         self.play_cand_mode  = False
         self.conflict_cells = validate_board(
-            self.grid_states[self.step_idx].values)
+            _snap_rows(self.grid_states[self.step_idx][0]))
+
+    def _set_play_value(self, r: int, c: int, v: int):
+        """Write a play-mode cell, keeping _play_wrong and the hint index current."""
+        sol = self.play_solution
+        if sol is not None:
+            self._play_wrong += (v != sol[r][c]) - (self.play_values[r][c] != sol[r][c])  # type: ignore[index]
+        self.play_values[r][c] = v   # type: ignore[index]
+        self._refresh_next_hint(r, c)
 
     def _check_play_complete(self):
-        if (self.play_values is not None and self.play_solution is not None
-                and self.play_values == self.play_solution):
+        if self.play_solution is not None and self._play_wrong == 0:
             self._confirm_dialog("Congratulations!",
                                  "You solved the puzzle! Press OK to continue.")
 
@@ -1757,18 +2154,29 @@ class SudokuApp:
     def _hint_step(self) -> Step | None:
         """Return the next unsolved step relevant to current display."""
         if self.mode == "play":
-            # Find the first step whose placement or elimination isn't yet filled in
-            for step in self.steps:
-                for r, c, d in step.placements:
-                    pv = self.play_values[r][c] if self.play_values else 0
-                    if pv != d:
-                        return step
+            if self._next_hint_idx < len(self.steps):
+                return self.steps[self._next_hint_idx]
             return self.steps[0] if self.steps else None
         else:
             if self.step_idx < len(self.steps):
                 return self.steps[self.step_idx]
             return None
 
+    def _refresh_next_hint(self, r: int = -1, c: int = -1):
+        """Advance _next_hint_idx past steps whose placements are all filled
+        in. Only editing a cell that an earlier step places can send it back,
+        so callers pass the cell they just changed."""
+        if self.play_values is None:
+            return
+        idx = self._next_hint_idx
+        if r >= 0 and 0 <= self._placed_by[r * 9 + c] < idx:
+            idx = self._placed_by[r * 9 + c]
+        pv = self.play_values
+        while idx < len(self.steps) and all(
+                pv[r2][c2] == d for r2, c2, d in self.steps[idx].placements):
+            idx += 1
+        self._next_hint_idx = idx
+
     def _hint_texts(self, step: Step) -> list[str]:
         """Return 4 progressively detailed hint strings for a step."""
         house = ""
@@ -1811,14 +2219,28 @@ class SudokuApp:
             self._run_brute_force()
 
     def _run_brute_force(self):
-        start = self.grid_states[-1].values
-        iters = [0]
-        result = _bt_solve([row[:] for row in start], iters)
+        result, iters = self._bt_solve_cached(_snap_rows(self.grid_states[-1][0]))
         if result is None:
             self._confirm_dialog("No solution", "This puzzle has no solution.")
         else:
             self.brute_force_grid  = result
-            self.brute_force_iters = iters[0]
+            self.brute_force_iters = iters
+
+    def _bt_solve_cached(self, values: list[list[int]]) -> tuple[list[list[int]] | None, int]:
+        """_bt_solve(values) and its iteration count, remembered per board so
+        re-entering play mode or brute force on the same puzzle is free.
+        Callers only read the returned grid."""
+        key = bytes(v for row in values for v in row)
+        hit = self._bt_results.get(key)
+        if hit is not None:
+            self._bt_results.move_to_end(key)
+            return hit
+        iters = [0]
+        hit = (_bt_solve([row[:] for row in values], iters), iters[0])
+        self._bt_results[key] = hit
+        if len(self._bt_results) > _BT_CACHE_MAX:
+            self._bt_results.popitem(last=False)
+        return hit
 
     # ──────────────────────────────────────────────────────────────────────────
     # File I/O dialogs
@@ -1837,73 +2259,102 @@ class SudokuApp:
 
         text      = default
         cursor_on = True
-        cursor_ms = 0
         ok_r      = pygame.Rect(dx + DW - 92,  dy + DH - 40, 80, 28)
         cancel_r  = pygame.Rect(dx + DW - 182, dy + DH - 40, 80, 28)
-
-        while True:
-            dt = self.clock.tick(30)
-            cursor_ms += dt
-            if cursor_ms >= 500:
-                cursor_ms = 0
-                cursor_on = not cursor_on
-
-            for ev in pygame.event.get():
-                if ev.type == pygame.QUIT:
-                    return None
-                elif ev.type == pygame.KEYDOWN:
-                    mods = pygame.key.get_mods()
-                    paste = mods & (pygame.KMOD_CTRL | pygame.KMOD_META)
-                    if ev.key == pygame.K_RETURN:
-                        return text.strip() or None
-                    elif ev.key == pygame.K_ESCAPE:
-                        return None
-                    elif ev.key == pygame.K_BACKSPACE:
-                        text = text[:-1]
-                    elif ev.key == pygame.K_v and paste:
-                        clip = _get_clipboard()
-                        if clip:
-                            text += "".join(c for c in clip if c.isprintable())
-                    elif ev.unicode and ev.unicode.isprintable():
-                        text += ev.unicode
-                elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
-                    if ok_r.collidepoint(ev.pos):
-                        return text.strip() or None
-                    elif cancel_r.collidepoint(ev.pos):
-                        return None
-
-            self.screen.blit(background, (0, 0))
-            p = self.p
-            box = pygame.Rect(dx, dy, DW, DH)
-            pygame.draw.rect(self.screen, p["panel_bg"], box, border_radius=6)
-            pygame.draw.rect(self.screen, p["grid_thick"], box, 2, border_radius=6)
-
-            surf = self.fonts["panel_title"].render(title, True, p["given_fg"])
-            self.screen.blit(surf, (dx + 14, dy + 10))
-
-            fr = pygame.Rect(dx + 14, dy + 40, DW - 28, 30)
-            pygame.draw.rect(self.screen, p["panel_bg"], fr)
-            pygame.draw.rect(self.screen, p["grid_thin"], fr, 1)
-
-            font  = self.fonts["panel_body"]
-            disp  = "*" * len(text) if masked else text
-            while disp and font.size(disp)[0] > fr.width - 10:
-                disp = disp[1:]
-            surf = font.render(disp, True, p["solved_fg"])
-            self.screen.blit(surf, (fr.x + 5, fr.y + 7))
+        fr        = pygame.Rect(dx + 14, dy + 40, DW - 28, 30)
+        font      = self.fonts["panel_body"]
+        p         = self.p
+
+        # The trimmed field text is rebuilt only when text changes, and the
+        # dialog only repaints on an edit or hover change; a caret blink
+        # alone just repaints the input field
+        shown:   str | None         = None
+        hovered: pygame.Rect | None = None
+        redraw   = True
+        blink    = False
+
+        def draw_field():
+            pygame.draw.rect(self.screen, p.panel_bg, fr)
+            pygame.draw.rect(self.screen, p.grid_thin, fr, 1)
+            self.screen.blit(field_surf, (fr.x + 5, fr.y + 7))
             if cursor_on:
-                cx = fr.x + 5 + font.size(disp)[0]
-                pygame.draw.line(self.screen, p["solved_fg"],
-                                 (cx, fr.y + 5), (cx, fr.y + 25), 1)
-
-            mouse = pygame.mouse.get_pos()
-            for rect, label in ((ok_r, "OK"), (cancel_r, "Cancel")):
-                bg = p["btn_hover"] if rect.collidepoint(mouse) else p["btn"]
-                pygame.draw.rect(self.screen, bg, rect, border_radius=4)
-                s = self.fonts["btn"].render(label, True, p["btn_text"])
-                self.screen.blit(s, s.get_rect(center=rect.center))
+                pygame.draw.line(self.screen, p.solved_fg,
+                                 (caret_x, fr.y + 5), (caret_x, fr.y + 25), 1)
 
-            pygame.display.flip()
+        # Sleep until input or the next caret blink instead of ticking at 30 FPS
+        pygame.time.set_timer(_CARET_BLINK, 500)
+        try:
+            while True:
+                if text != shown:
+                    shown = text
+                    disp  = "*" * len(text) if masked else text
+                    while disp and font.size(disp)[0] > fr.width - 10:
+                        disp = disp[1:]
+                    field_surf = font.render(disp, True, p.solved_fg)
+                    caret_x    = fr.x + 5 + font.size(disp)[0]
+                    redraw     = True
+
+                mouse = pygame.mouse.get_pos()
+                hover = ok_r if ok_r.collidepoint(mouse) else (
+                    cancel_r if cancel_r.collidepoint(mouse) else None)
+                if hover is not hovered:
+                    hovered = hover
+                    redraw  = True
+
+                if redraw:
+                    self.screen.blit(background, (0, 0))
+                    box = pygame.Rect(dx, dy, DW, DH)
+                    pygame.draw.rect(self.screen, p.panel_bg, box, border_radius=6)
+                    pygame.draw.rect(self.screen, p.grid_thick, box, 2, border_radius=6)
+
+                    surf = self._text("panel_title", title, p.given_fg)
+                    self.screen.blit(surf, (dx + 14, dy + 10))
+                    draw_field()
+
+                    for rect, label in ((ok_r, "OK"), (cancel_r, "Cancel")):
+                        bg = p.btn_hover if rect is hovered else p.btn
+                        pygame.draw.rect(self.screen, bg, rect, border_radius=4)
+                        s = self._text("btn", label, p.btn_text)
+                        self.screen.blit(s, s.get_rect(center=rect.center))
+
+                    pygame.display.flip()
+                elif blink:
+                    draw_field()
+                    pygame.display.update(fr)
+                redraw = blink = False
+
+                for ev in [pygame.event.wait()] + pygame.event.get():
+                    if ev.type == _CARET_BLINK:
+                        cursor_on = not cursor_on
+                        blink     = True
+                    elif ev.type == pygame.QUIT:
+                        return None
+                    elif ev.type == pygame.KEYDOWN:
+                        mods = pygame.key.get_mods()
+                        paste = mods & (pygame.KMOD_CTRL | pygame.KMOD_META)
+                        if ev.key == pygame.K_RETURN:
+                            return text.strip() or None
+                        elif ev.key == pygame.K_ESCAPE:
+                            return None
+                        elif ev.key == pygame.K_BACKSPACE:
+                            text = text[:-1]
+                        elif ev.key == pygame.K_v and paste:
+                            clip = _get_clipboard()
+                            if clip:
+                                text += "".join(c for c in clip if c.isprintable())
+                        elif ev.unicode and ev.unicode.isprintable():
+                            text += ev.unicode
+                    elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
+                        if ok_r.collidepoint(ev.pos):
+                            return text.strip() or None
+                        elif cancel_r.collidepoint(ev.pos):
+                            return None
+                    elif ev.type != pygame.MOUSEMOTION:
+                        redraw = True   # e.g. window exposed
+        finally:
+            pygame.time.set_timer(_CARET_BLINK, 0)
+            pygame.event.clear(_CARET_BLINK)
+            self.clock.tick()   # don't count time spent here as a frame
 
     def _confirm_dialog(self, title: str, message: str) -> bool:
         DW, DH = 460, 160
@@ -1918,47 +2369,65 @@ class SudokuApp:
 
         yes_r = pygame.Rect(dx + DW - 94,  dy + DH - 40, 80, 28)
         no_r  = pygame.Rect(dx + DW - 184, dy + DH - 40, 80, 28)
-
-        while True:
-            self.clock.tick(30)
-            for ev in pygame.event.get():
-                if ev.type == pygame.QUIT:
-                    return False
-                elif ev.type == pygame.KEYDOWN:
-                    if ev.key in (pygame.K_RETURN, pygame.K_y):
-                        return True
-                    elif ev.key in (pygame.K_ESCAPE, pygame.K_n):
-                        return False
-                elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
-                    if yes_r.collidepoint(ev.pos):
-                        return True
-                    if no_r.collidepoint(ev.pos):
+        p     = self.p
+
+        # Box, title and message never change while open; only the buttons
+        # are repainted on top for hover
+        box = pygame.Rect(dx, dy, DW, DH)
+        pygame.draw.rect(background, p.panel_bg, box, border_radius=6)
+        pygame.draw.rect(background, p.grid_thick, box, 2, border_radius=6)
+        background.blit(self._text("panel_title", title, p.given_fg), (dx + 14, dy + 10))
+        lines: list = []
+        self._wrapped(lines, message, dx + 14, dy + 38,
+                      DW - 28, self.fonts["panel_body"], p.solved_fg)
+        background.blits(lines, doreturn=False)
+
+        # Nothing animates here: sleep until input and repaint only when an
+        # event or a hover change can have altered the dialog
+        hovered: pygame.Rect | None = None
+        redraw = True
+        try:
+            while True:
+                mouse = pygame.mouse.get_pos()
+                hover = yes_r if yes_r.collidepoint(mouse) else (
+                    no_r if no_r.collidepoint(mouse) else None)
+                if hover is not hovered:
+                    hovered = hover
+                    redraw  = True
+
+                if redraw:
+                    self.screen.blit(background, (0, 0))
+                    for rect, label, base in (
+                        (yes_r, "Yes", p.btn_on),
+                        (no_r,  "No",  p.btn),
+                    ):
+                        r, g, b = base
+                        bg = (min(r+20,255), min(g+20,255), min(b+20,255)) \
+                             if rect is hovered else base
+                        pygame.draw.rect(self.screen, bg, rect, border_radius=4)
+                        s = self._text("btn", label, p.btn_text)
+                        self.screen.blit(s, s.get_rect(center=rect.center))
+
+                    pygame.display.flip()
+                    redraw = False
+
+                for ev in [pygame.event.wait()] + pygame.event.get():
+                    if ev.type == pygame.QUIT:
                         return False
-
-            p = self.p
-            self.screen.blit(background, (0, 0))
-            box = pygame.Rect(dx, dy, DW, DH)
-            pygame.draw.rect(self.screen, p["panel_bg"], box, border_radius=6)
-            pygame.draw.rect(self.screen, p["grid_thick"], box, 2, border_radius=6)
-
-            surf = self.fonts["panel_title"].render(title, True, p["given_fg"])
-            self.screen.blit(surf, (dx + 14, dy + 10))
-            self._wrapped(self.screen, message, dx + 14, dy + 38,
-                          DW - 28, self.fonts["panel_body"], p["solved_fg"])
-
-            mouse = pygame.mouse.get_pos()
-            for rect, label, base in (
-                (yes_r, "Yes", p["btn_on"]),
-                (no_r,  "No",  p["btn"]),
-            ):
-                r, g, b = base
-                bg = (min(r+20,255), min(g+20,255), min(b+20,255)) \
-                     if rect.collidepoint(mouse) else base
-                pygame.draw.rect(self.screen, bg, rect, border_radius=4)
-                s = self.fonts["btn"].render(label, True, p["btn_text"])
-                self.screen.blit(s, s.get_rect(center=rect.center))
-
-            pygame.display.flip()
+                    elif ev.type == pygame.KEYDOWN:
+                        if ev.key in (pygame.K_RETURN, pygame.K_y):
+                            return True
+                        elif ev.key in (pygame.K_ESCAPE, pygame.K_n):
+                            return False
+                    elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
+                        if yes_r.collidepoint(ev.pos):
+                            return True
+                        if no_r.collidepoint(ev.pos):
+                            return False
+                    if ev.type != pygame.MOUSEMOTION:
+                        redraw = True
+        finally:
+            self.clock.tick()   # don't count time spent here as a frame
 
     @staticmethod
     def _ensure_txt(path: str) -> str:
@@ -1986,7 +2455,7 @@ class SudokuApp:
         path = self._ensure_txt(path)
         values = (self.input_values  if self.mode == "input"  and self.input_values
                   else self.create_values if self.mode == "create" and self.create_values
-                  else self.grid_states[self.step_idx].values)
+                  else _snap_rows(self.grid_states[self.step_idx][0]))
         try:
             with open(path, "w") as f:
                 for row in values:
@@ -2024,8 +2493,8 @@ class SudokuApp:
 
         def tier_puzzles(t: int):
             if t <= 4:
-                return get_puzzles_by_tier(t) if HAS_PUZZLES else []
-            return []   # tier 5 = generate
+                return get_puzzles_by_tier(t) if HAS_PUZZLES else ()
+            return ()   # tier 5 = generate
 
         def load_selected():
             plist = tier_puzzles(cur_tier)
@@ -2037,7 +2506,7 @@ class SudokuApp:
             if not plist or selected >= len(plist):
                 return None
             entry = plist[selected]
-            vals  = [[int(ch) for ch in row] for row in entry["rows"]]
+            vals  = [[ch - 0x30 for ch in row] for row in entry["rows"]]  # ASCII digits
             return vals
 
         close_r  = pygame.Rect(dx + DW - 40, dy + 8, 30, 22)
@@ -2048,145 +2517,188 @@ class SudokuApp:
         for i, t in enumerate(tiers):
             tier_rects.append(pygame.Rect(dx + 14 + i * 76, dy + 46, 68, 24))
 
-        while True:
-            self.clock.tick(30)
-            for ev in pygame.event.get():
-                if ev.type == pygame.QUIT:
-                    return
-                elif ev.type == pygame.KEYDOWN:
-                    if ev.key == pygame.K_ESCAPE:
-                        return
-                    elif ev.key == pygame.K_UP:
-                        selected = max(0, selected - 1)
-                        scroll   = min(scroll, selected)
-                    elif ev.key == pygame.K_DOWN:
-                        plist = tier_puzzles(cur_tier)
-                        selected = min(len(plist) - 1, selected + 1)
-                        if selected >= scroll + ITEMS_VIS:
-                            scroll = selected - ITEMS_VIS + 1
-                    elif ev.key in (pygame.K_RETURN, pygame.K_SPACE):
-                        result = load_selected()
-                        if result == "generate":
-                            self._do_generate(cur_tier)
-                            return
-                        elif result:
-                            self.load_puzzle(result)
-                            return
-                elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
-                    if close_r.collidepoint(ev.pos):
-                        return
-                    for i, tr in enumerate(tier_rects):
-                        if tr.collidepoint(ev.pos):
-                            cur_tier = tiers[i]
-                            selected = 0
-                            scroll   = 0
-                    # List items
-                    plist = tier_puzzles(cur_tier)
-                    for i in range(ITEMS_VIS):
-                        ir = pygame.Rect(LIST_X, LIST_Y + i * ITEM_H,
-                                         DW - 28, ITEM_H)
-                        if ir.collidepoint(ev.pos):
-                            idx = scroll + i
-                            if idx < len(plist):
-                                if selected == idx:
-                                    result = load_selected()
-                                    if result and result != "generate":
-                                        self.load_puzzle(result)
-                                        return
-                                selected = idx
-                    if load_r.collidepoint(ev.pos):
-                        result = load_selected()
-                        if result == "generate":
-                            self._do_generate(cur_tier)
-                            return
-                        elif result:
-                            self.load_puzzle(result)
-                            return
-                    if gen_r.collidepoint(ev.pos) and HAS_GENERATOR:
-                        self._do_generate(cur_tier)
-                        return
-                elif ev.type == pygame.MOUSEWHEEL:
-                    plist = tier_puzzles(cur_tier)
-                    scroll = max(0, min(len(plist) - ITEMS_VIS,
-                                        scroll - ev.y))
-
-            # Draw
-            p2 = self.p
-            self.screen.blit(background, (0, 0))
+        def build_chrome() -> pygame.Surface:
+            """Everything but the list rows, for the current tier."""
+            chrome = background.copy()
             box = pygame.Rect(dx, dy, DW, DH)
-            pygame.draw.rect(self.screen, p2["panel_bg"], box, border_radius=8)
-            pygame.draw.rect(self.screen, p2["grid_thick"], box, 2, border_radius=8)
+            pygame.draw.rect(chrome, p.panel_bg, box, border_radius=8)
+            pygame.draw.rect(chrome, p.grid_thick, box, 2, border_radius=8)
 
-            surf = self.fonts["panel_title"].render("Puzzle Library", True, p2["given_fg"])
-            self.screen.blit(surf, (dx + 14, dy + 14))
+            surf = self._text("panel_title", "Puzzle Library", p.given_fg)
+            chrome.blit(surf, (dx + 14, dy + 14))
 
             # Close button
-            pygame.draw.rect(self.screen, p2["btn_danger"], close_r, border_radius=3)
-            s = self.fonts["btn"].render("✕", True, p2["btn_text"])
-            self.screen.blit(s, s.get_rect(center=close_r.center))
+            pygame.draw.rect(chrome, p.btn_danger, close_r, border_radius=3)
+            s = self._text("btn", "✕", p.btn_text)
+            chrome.blit(s, s.get_rect(center=close_r.center))
 
             # Tier tabs
-            for i, (t, tr) in enumerate(zip(tiers, tier_rects)):
-                is_cur = (t == cur_tier)
-                bg = p2["btn_on"] if is_cur else p2["btn"]
-                pygame.draw.rect(self.screen, bg, tr, border_radius=4)
+            for t, tr in zip(tiers, tier_rects):
+                bg = p.btn_on if t == cur_tier else p.btn
+                pygame.draw.rect(chrome, bg, tr, border_radius=4)
                 label = ("Tier 0 ★" if t == 0
                          else f"Tier {t}" if t <= 4
                          else "Generate")
-                s = self.fonts["btn"].render(label, True, p2["btn_text"])
-                self.screen.blit(s, s.get_rect(center=tr.center))
+                s = self._text("btn", label, p.btn_text)
+                chrome.blit(s, s.get_rect(center=tr.center))
 
-            # List
-            plist = tier_puzzles(cur_tier)
-            pygame.draw.rect(self.screen,
-                             p2["bg"],
-                             pygame.Rect(LIST_X - 2, LIST_Y - 2,
-                                         DW - 24, LIST_H + 4),
+            # List backdrop, or a message in place of the list
+            pygame.draw.rect(chrome, p.bg,
+                             pygame.Rect(LIST_X - 2, LIST_Y - 2, DW - 24, LIST_H + 4),
                              border_radius=4)
-            if not plist and cur_tier <= 4:
-                s = self.fonts["panel_body"].render(
-                    "No puzzles (puzzles.py not found)", True, p2["warn"])
-                self.screen.blit(s, (LIST_X + 4, LIST_Y + 8))
+            if not tier_puzzles(cur_tier) and cur_tier <= 4:
+                s = self._text("panel_body",
+                               "No puzzles (puzzles.py not found)", p.warn)
+                chrome.blit(s, (LIST_X + 4, LIST_Y + 8))
             elif cur_tier == 5:
                 msg = ("Click GENERATE to create a new puzzle."
                        if HAS_GENERATOR else
                        "sudoku_generator.py not found.")
-                s = self.fonts["panel_body"].render(msg, True, p2["cand_fg"])
-                self.screen.blit(s, (LIST_X + 4, LIST_Y + 8))
-            else:
-                for i in range(ITEMS_VIS):
-                    idx = scroll + i
-                    if idx >= len(plist):
-                        break
-                    entry = plist[idx]
-                    ir = pygame.Rect(LIST_X, LIST_Y + i * ITEM_H, DW - 28, ITEM_H)
-                    if idx == selected:
-                        pygame.draw.rect(self.screen, p2["btn"], ir, border_radius=3)
-                    s = self.fonts["panel_body"].render(
-                        entry["name"], True,
-                        p2["btn_text"] if idx == selected else p2["solved_fg"])
-                    self.screen.blit(s, (ir.x + 6, ir.y + 3))
+                s = self._text("panel_body", msg, p.cand_fg)
+                chrome.blit(s, (LIST_X + 4, LIST_Y + 8))
 
             # Buttons
-            pygame.draw.rect(self.screen, p2["btn_on"], load_r, border_radius=4)
-            s = self.fonts["btn"].render("Load", True, p2["btn_text"])
-            self.screen.blit(s, s.get_rect(center=load_r.center))
+            pygame.draw.rect(chrome, p.btn_on, load_r, border_radius=4)
+            s = self._text("btn", "Load", p.btn_text)
+            chrome.blit(s, s.get_rect(center=load_r.center))
 
             if HAS_GENERATOR:
-                pygame.draw.rect(self.screen, p2["btn"], gen_r, border_radius=4)
-                s = self.fonts["btn"].render("Generate", True, p2["btn_text"])
-                self.screen.blit(s, s.get_rect(center=gen_r.center))
-
-            pygame.display.flip()
+                pygame.draw.rect(chrome, p.btn, gen_r, border_radius=4)
+                s = self._text("btn", "Generate", p.btn_text)
+                chrome.blit(s, s.get_rect(center=gen_r.center))
+            return chrome
+
+        # Nothing animates here: sleep until input and repaint only after
+        # an event that can have changed the tier, selection or scroll.
+        # The static chrome is composited once per tier.
+        chrome: pygame.Surface | None = None
+        chrome_tier = -1
+        redraw = True
+        try:
+            while True:
+                if redraw:
+                    if chrome_tier != cur_tier:
+                        chrome, chrome_tier = build_chrome(), cur_tier
+                    self.screen.blit(chrome, (0, 0))
 
-    def _do_generate(self, target_tier: int):
-        """Generate a puzzle of the given tier (blocks briefly)."""
+                    # List
+                    plist = tier_puzzles(cur_tier)
+                    if cur_tier <= 4:
+                        for i in range(ITEMS_VIS):
+                            idx = scroll + i
+                            if idx >= len(plist):
+                                break
+                            entry = plist[idx]
+                            ir = pygame.Rect(LIST_X, LIST_Y + i * ITEM_H, DW - 28, ITEM_H)
+                            if idx == selected:
+                                pygame.draw.rect(self.screen, p.btn, ir, border_radius=3)
+                            s = self._text(
+                                "panel_body", entry["name"],
+                                p.btn_text if idx == selected else p.solved_fg)
+                            self.screen.blit(s, (ir.x + 6, ir.y + 3))
+
+                    pygame.display.flip()
+                    redraw = False
+
+                for ev in [pygame.event.wait()] + pygame.event.get():
+                    if ev.type == pygame.QUIT:
+                        return
+                    elif ev.type == pygame.KEYDOWN:
+                        if ev.key == pygame.K_ESCAPE:
+                            return
+                        elif ev.key == pygame.K_UP:
+                            selected = max(0, selected - 1)
+                            scroll   = min(scroll, selected)
+                        elif ev.key == pygame.K_DOWN:
+                            plist = tier_puzzles(cur_tier)
+                            selected = min(len(plist) - 1, selected + 1)
+                            if selected >= scroll + ITEMS_VIS:
+                                scroll = selected - ITEMS_VIS + 1
+                        elif ev.key in (pygame.K_RETURN, pygame.K_SPACE):
+                            result = load_selected()
+                            if result == "generate":
+                                self._start_generate(cur_tier)
+                                return
+                            elif result:
+                                self.load_puzzle(result)
+                                return
+                    elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
+                        if close_r.collidepoint(ev.pos):
+                            return
+                        for i, tr in enumerate(tier_rects):
+                            if tr.collidepoint(ev.pos):
+                                cur_tier = tiers[i]
+                                selected = 0
+                                scroll   = 0
+                        # List items
+                        plist = tier_puzzles(cur_tier)
+                        for i in range(ITEMS_VIS):
+                            ir = pygame.Rect(LIST_X, LIST_Y + i * ITEM_H,
+                                             DW - 28, ITEM_H)
+                            if ir.collidepoint(ev.pos):
+                                idx = scroll + i
+                                if idx < len(plist):
+                                    if selected == idx:
+                                        result = load_selected()
+                                        if result and result != "generate":
+                                            self.load_puzzle(result)
+                                            return
+                                    selected = idx
+                        if load_r.collidepoint(ev.pos):
+                            result = load_selected()
+                            if result == "generate":
+                                self._start_generate(cur_tier)
+                                return
+                            elif result:
+                                self.load_puzzle(result)
+                                return
+                        if gen_r.collidepoint(ev.pos) and HAS_GENERATOR:
+                            self._start_generate(cur_tier)
+                            return
+                    elif ev.type == pygame.MOUSEWHEEL:
+                        plist = tier_puzzles(cur_tier)
+                        scroll = max(0, min(len(plist) - ITEMS_VIS,
+                                            scroll - ev.y))
+                    if ev.type != pygame.MOUSEMOTION:
+                        redraw = True
+        finally:
+            self.clock.tick()   # don't count time spent here as a frame
+
+    def _start_generate(self, target_tier: int):
+        """Generate a puzzle of the given tier in a worker process; the UI
+        stays live and _check_generate_ready loads it when done."""
         if not HAS_GENERATOR:
             return
-        self._confirm_dialog("Generating…",
-                             "Generating puzzle — this may take a few seconds.")
-        vals = generate_puzzle(target_tier=min(target_tier, 4),
-                               max_attempts=30)
+        self._stop_generate()
+        recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+        proc = multiprocessing.Process(target=_generate_process,
+                                       args=(target_tier, send_conn),
+                                       daemon=True)
+        proc.start()
+        send_conn.close()
+        self._gen_proc, self._gen_conn = proc, recv_conn
+        self._dirty = True
+
+    def _stop_generate(self):
+        """Abandon any in-flight puzzle generation."""
+        if self._gen_proc is not None:
+            self._gen_conn.close()   # type: ignore[union-attr]
+            if self._gen_proc.is_alive():
+                self._gen_proc.kill()   # see _close_compute_worker
+            self._gen_proc.join()
+            self._gen_proc = self._gen_conn = None
+
+    def _check_generate_ready(self):
+        """Call from main loop; loads the puzzle when the generator finishes."""
+        conn = self._gen_conn
+        if conn is None or not conn.poll():
+            return
+        try:
+            vals = conn.recv()
+        except EOFError:
+            vals = None   # worker died without a result
+        self._stop_generate()
+        self._dirty = True
         if vals is None:
             self._confirm_dialog("Failed",
                                  "Could not generate a puzzle of that tier.")
@@ -2244,6 +2756,7 @@ class SudokuApp:
         if text:
             vals = self._parse_puzzle_text(text)
             if vals is not None:
+                self._stop_generate()
                 self.mode          = "input"
                 self.input_values  = vals
                 self.input_history = []
@@ -2402,9 +2915,8 @@ class SudokuApp:
         if key is None:
             return
         self.anthropic_api_key = key
-        cfg = load_config()
-        cfg["anthropic_api_key"] = key
-        save_config(cfg)
+        self.cfg["anthropic_api_key"] = key
+        save_config(self.cfg)
         self._show_status("API key saved." if key else "API key cleared.")
 
     def _export_png(self):
@@ -2423,23 +2935,51 @@ class SudokuApp:
     # Text rendering helper
     # ──────────────────────────────────────────────────────────────────────────
 
-    def _wrapped(self, target, text: str, x: int, y: int,
+    def _word_width(self, font, word: str) -> int:
+        key   = (id(font), word)
+        width = self._word_widths.get(key)
+        if width is None:
+            if len(self._word_widths) >= _WORD_WIDTH_CACHE_MAX:
+                self._word_widths.clear()
+            width = self._word_widths[key] = font.size(word)[0]
+        return width
+
+    def _wrapped(self, blits: list, text: str, x: int, y: int,
                  max_w: int, font, color) -> int:
-        words = text.split()
-        line  = ""
-        for word in words:
-            test = (line + " " + word).strip()
-            if font.size(test)[0] <= max_w:
-                line = test
+        """Word-wrap text to max_w, queueing (line, pos) pairs onto blits."""
+        # Line widths are summed from cached word widths.  Kerning and
+        # rounding make each join up to ~2px off, so only a sum within that
+        # margin of max_w is settled by measuring the actual line.
+        space_w = self._word_width(font, " ")
+        line    = ""
+        line_w  = 0
+        slack   = 0
+        for word in text.split():
+            word_w = self._word_width(font, word)
+            if not line:
+                line, line_w, slack = word, word_w, 0
+                continue
+            test_w = line_w + space_w + word_w
+            slack += 3
+            if test_w > max_w + slack:
+                fits = False
+            elif test_w <= max_w - slack:
+                fits = True
             else:
-                if line:
-                    surf = font.render(line, True, color)
-                    target.blit(surf, (x, y))
-                    y += surf.get_height() + 1
-                line = word
+                test_w = font.size(line + " " + word)[0]
+                fits   = test_w <= max_w
+                slack  = 0
+            if fits:
+                line   += " " + word
+                line_w  = test_w
+            else:
+                surf = font.render(line, True, color)
+                blits.append((surf, (x, y)))
+                y += surf.get_height() + 1
+                line, line_w, slack = word, word_w, 0
         if line:
             surf = font.render(line, True, color)
-            target.blit(surf, (x, y))
+            blits.append((surf, (x, y)))
             y += surf.get_height() + 1
         return y
 
@@ -2453,6 +2993,7 @@ class SudokuApp:
             dt      = self.clock.tick(60)
             running = self.handle_events()
             self._check_compute_ready()
+            self._check_generate_ready()
 
             if self.auto_play and self.mode == "solve":
                 self.auto_timer += dt
@@ -2464,7 +3005,9 @@ class SudokuApp:
                         self.auto_play = False
 
             total = len(self.steps)
-            if self._computing:
+            if self._gen_proc is not None:
+                state = "Generating…"
+            elif self._computing:
                 state = "Computing…"
             elif self.mode == "play":
                 state = "PLAY"
@@ -2480,15 +3023,21 @@ class SudokuApp:
                 state = f"Step {self.step_idx}/{total}"
             pygame.display.set_caption(f"Sudoku Tutor  —  {state}")
 
-            self.draw()
+            if self._dirty or self.auto_play or self._computing:
+                self.draw()
+            elif self._dirty_rects:
+                self.draw_dirty()
 
-        # Save config before quitting
-        save_config({
+        # Save config before quitting (skipped when no setting changed)
+        settings = {
             "dark_mode":         self.dark_mode,
             "show_candidates":   self.show_candidates,
             "auto_interval":     self.auto_interval,
             "anthropic_api_key": self.anthropic_api_key,
-        })
+        }
+        if any(self.cfg.get(k) != v for k, v in settings.items()):
+            self.cfg.update(settings)
+            save_config(self.cfg)
         pygame.quit()
 
 
@@ -24,7 +24,7 @@ Strategies implemented (in order of application):
 
 import sys
 import argparse
-from collections import deque
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from itertools import combinations
 from typing import Optional
@@ -62,6 +62,33 @@ class Step:
     pattern_cells: list = field(default_factory=list)   # [(row, col)] strategy-defining cells
 
 
+# The 20 row/column/box peers of each cell, indexed by r*9+c; built once
+PEERS: list[tuple[tuple[int, int], ...]] = [
+    tuple(sorted(({(r, c2) for c2 in range(9)}
+                  | {(r2, c) for r2 in range(9)}
+                  | {((r // 3) * 3 + dr, (c // 3) * 3 + dc)
+                     for dr in range(3) for dc in range(3)})
+                 - {(r, c)}))
+    for r in range(9) for c in range(9)
+]
+
+# Box index of each cell, indexed by r*9+c
+BOX_OF: list[int] = [(r // 3) * 3 + c // 3 for r in range(9) for c in range(9)]
+
+# Cells of each box in row-major order, indexed by box number
+CELLS_OF_BOX: tuple[tuple[tuple[int, int], ...], ...] = tuple(
+    tuple(((b // 3) * 3 + dr, (b % 3) * 3 + dc) for dr in range(3) for dc in range(3))
+    for b in range(9)
+)
+
+# All 27 houses as (type, index, cells): rows, then columns, then boxes
+HOUSES: list[tuple[str, int, tuple[tuple[int, int], ...]]] = (
+    [('row', r, tuple((r, c) for c in range(9))) for r in range(9)]
+    + [('col', c, tuple((r, c) for r in range(9))) for c in range(9)]
+    + [('box', b, CELLS_OF_BOX[b]) for b in range(9)]
+)
+
+
 class Grid:
     """9×9 Sudoku grid with full candidate-set tracking."""
 
@@ -82,35 +109,22 @@ class Grid:
                     self._remove_from_peers(r, c, self.values[r][c])
 
     def _remove_from_peers(self, r: int, c: int, d: int):
-        for r2, c2 in self.all_peers(r, c):
-            self.candidates[r2][c2].discard(d)
+        candidates = self.candidates
+        for r2, c2 in PEERS[r * 9 + c]:
+            candidates[r2][c2].discard(d)
 
     def all_peers(self, r: int, c: int) -> list:
-        peers = set()
-        for c2 in range(9): peers.add((r, c2))
-        for r2 in range(9): peers.add((r2, c))
-        for cell in self.cells_of_box(self.box_of(r, c)): peers.add(cell)
-        peers.discard((r, c))
-        return list(peers)
+        return list(PEERS[r * 9 + c])
 
     @staticmethod
     def box_of(r: int, c: int) -> int:
-        return (r // 3) * 3 + (c // 3)
+        return BOX_OF[r * 9 + c]
 
-    @staticmethod
-    def cells_of_box(box: int) -> list:
-        br, bc = (box // 3) * 3, (box % 3) * 3
-        return [(br + dr, bc + dc) for dr in range(3) for dc in range(3)]
+    # Straight table lookup, no Python frame: cells_of_box(box) -> tuple of (r, c)
+    cells_of_box = staticmethod(CELLS_OF_BOX.__getitem__)
 
     def get_houses(self) -> list:
-        houses = []
-        for r in range(9):
-            houses.append(('row', r, [(r, c) for c in range(9)]))
-        for c in range(9):
-            houses.append(('col', c, [(r, c) for r in range(9)]))
-        for b in range(9):
-            houses.append(('box', b, self.cells_of_box(b)))
-        return houses
+        return HOUSES
 
     def cell_sees(self, r1: int, c1: int, r2: int, c2: int) -> bool:
         if (r1, c1) == (r2, c2):
@@ -131,6 +145,24 @@ class Grid:
     def empty_cells(self) -> list:
         return [(r, c) for r in range(9) for c in range(9) if self.values[r][c] == 0]
 
+    def snapshot(self) -> tuple[bytes, bytes]:
+        """Pack into (81 value bytes, 81 little-endian uint16 candidate masks).
+
+        Bit d-1 of a cell's mask is set when digit d is a candidate.
+        """
+        values = bytes(v for row in self.values for v in row)
+        cands  = bytearray(162)
+        i = 0
+        for row in self.candidates:
+            for s in row:
+                m = 0
+                for d in s:
+                    m |= 1 << (d - 1)
+                cands[i] = m & 0xFF
+                cands[i + 1] = m >> 8
+                i += 2
+        return values, bytes(cands)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Display Helpers
@@ -1111,6 +1143,16 @@ def find_simple_coloring(grid: Grid) -> Optional[Step]:
 # Tier 4 — Expert Strategies
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Rectangles (r1, c1, r2, c2) whose corners span exactly 2 boxes, in the
+# row-pair then column-pair order find_unique_rectangle scans them
+_UR_RECTANGLES: list[tuple[int, int, int, int]] = [
+    (r1, c1, r2, c2)
+    for r1, r2 in combinations(range(9), 2)
+    for c1, c2 in combinations(range(9), 2)
+    if len({BOX_OF[r1 * 9 + c1], BOX_OF[r1 * 9 + c2],
+            BOX_OF[r2 * 9 + c1], BOX_OF[r2 * 9 + c2]}) == 2
+]
+
 def find_unique_rectangle(grid: Grid) -> Optional[Step]:
     """
     Unique Rectangle (UR): Assumes the puzzle has a unique solution.
@@ -1124,29 +1166,60 @@ def find_unique_rectangle(grid: Grid) -> Optional[Step]:
                X must go in one of the two "roof" cells — eliminate X from
                any cell seeing both roofs.
     """
+    # Both types need at least two corners that are exactly {A,B}
+    bivalue = Counter(frozenset(s) for row in grid.candidates for s in row if len(s) == 2)
     for d1, d2 in combinations(range(1, 10), 2):
         pair = frozenset({d1, d2})
-        for r1, r2 in combinations(range(9), 2):
-            for c1, c2 in combinations(range(9), 2):
-                cells = [(r1, c1), (r1, c2), (r2, c1), (r2, c2)]
-                # Rectangle must span exactly 2 boxes
-                boxes = {Grid.box_of(r, c) for r, c in cells}
-                if len(boxes) != 2:
-                    continue
-                # All 4 cells must be empty with {A,B} ⊆ candidates
-                if not all(
-                    grid.values[r][c] == 0 and pair.issubset(grid.candidates[r][c])
-                    for r, c in cells
-                ):
-                    continue
-                floors = [(r, c) for r, c in cells if grid.candidates[r][c] == pair]
-                roofs  = [(r, c) for r, c in cells if grid.candidates[r][c] != pair]
-                # UR Type 1: 3 floors, 1 roof
-                if len(floors) == 3 and len(roofs) == 1:
-                    rr, rc = roofs[0]
+        if bivalue[pair] < 2:
+            continue
+        for r1, c1, r2, c2 in _UR_RECTANGLES:
+            cells = [(r1, c1), (r1, c2), (r2, c1), (r2, c2)]
+            # All 4 cells must be empty with {A,B} ⊆ candidates
+            if not all(
+                grid.values[r][c] == 0 and pair.issubset(grid.candidates[r][c])
+                for r, c in cells
+            ):
+                continue
+            floors = [(r, c) for r, c in cells if grid.candidates[r][c] == pair]
+            roofs  = [(r, c) for r, c in cells if grid.candidates[r][c] != pair]
+            # UR Type 1: 3 floors, 1 roof
+            if len(floors) == 3 and len(roofs) == 1:
+                rr, rc = roofs[0]
+                eliminations = [
+                    (rr, rc, d) for d in (d1, d2)
+                    if d in grid.candidates[rr][rc]
+                ]
+                if eliminations:
+                    return Step(
+                        strategy="Unique Rectangle",
+                        eliminations=eliminations,
+                        pattern_cells=cells,
+                        explanation=(
+                            f"Unique Rectangle (Type 1) with digits {d1},{d2} at "
+                            f"{cell_name(r1,c1)},{cell_name(r1,c2)},"
+                            f"{cell_name(r2,c1)},{cell_name(r2,c2)}. "
+                            f"Three corners have exactly {{{d1},{d2}}}. "
+                            f"If {cell_name(rr,rc)} also only contained {{{d1},{d2}}}, "
+                            f"the puzzle would have multiple solutions (deadly pattern). "
+                            f"Therefore {d1} and {d2} can be eliminated from {cell_name(rr,rc)}."
+                        ),
+                    )
+            # UR Type 2: 2 floors, 2 roofs with same single extra digit X
+            if len(floors) == 2 and len(roofs) == 2:
+                extras1 = grid.candidates[roofs[0][0]][roofs[0][1]] - pair
+                extras2 = grid.candidates[roofs[1][0]][roofs[1][1]] - pair
+                if extras1 == extras2 and len(extras1) == 1:
+                    X = next(iter(extras1))
+                    rr1, rc1 = roofs[0]
+                    rr2, rc2 = roofs[1]
                     eliminations = [
-                        (rr, rc, d) for d in (d1, d2)
-                        if d in grid.candidates[rr][rc]
+                        (r, c, X)
+                        for r in range(9) for c in range(9)
+                        if (r, c) not in cells
+                        and grid.values[r][c] == 0
+                        and X in grid.candidates[r][c]
+                        and grid.cell_sees(r, c, rr1, rc1)
+                        and grid.cell_sees(r, c, rr2, rc2)
                     ]
                     if eliminations:
                         return Step(
@@ -1154,47 +1227,15 @@ def find_unique_rectangle(grid: Grid) -> Optional[Step]:
                             eliminations=eliminations,
                             pattern_cells=cells,
                             explanation=(
-                                f"Unique Rectangle (Type 1) with digits {d1},{d2} at "
+                                f"Unique Rectangle (Type 2) with digits {d1},{d2} at "
                                 f"{cell_name(r1,c1)},{cell_name(r1,c2)},"
                                 f"{cell_name(r2,c1)},{cell_name(r2,c2)}. "
-                                f"Three corners have exactly {{{d1},{d2}}}. "
-                                f"If {cell_name(rr,rc)} also only contained {{{d1},{d2}}}, "
-                                f"the puzzle would have multiple solutions (deadly pattern). "
-                                f"Therefore {d1} and {d2} can be eliminated from {cell_name(rr,rc)}."
+                                f"Two corners are exactly {{{d1},{d2}}}; the other two "
+                                f"also contain extra digit {X}. To avoid a deadly pattern, "
+                                f"{X} must occupy one of {cell_name(rr1,rc1)} or "
+                                f"{cell_name(rr2,rc2)}. Cells seeing both cannot hold {X}."
                             ),
                         )
-                # UR Type 2: 2 floors, 2 roofs with same single extra digit X
-                if len(floors) == 2 and len(roofs) == 2:
-                    extras1 = grid.candidates[roofs[0][0]][roofs[0][1]] - pair
-                    extras2 = grid.candidates[roofs[1][0]][roofs[1][1]] - pair
-                    if extras1 == extras2 and len(extras1) == 1:
-                        X = next(iter(extras1))
-                        rr1, rc1 = roofs[0]
-                        rr2, rc2 = roofs[1]
-                        eliminations = [
-                            (r, c, X)
-                            for r in range(9) for c in range(9)
-                            if (r, c) not in cells
-                            and grid.values[r][c] == 0
-                            and X in grid.candidates[r][c]
-                            and grid.cell_sees(r, c, rr1, rc1)
-                            and grid.cell_sees(r, c, rr2, rc2)
-                        ]
-                        if eliminations:
-                            return Step(
-                                strategy="Unique Rectangle",
-                                eliminations=eliminations,
-                                pattern_cells=cells,
-                                explanation=(
-                                    f"Unique Rectangle (Type 2) with digits {d1},{d2} at "
-                                    f"{cell_name(r1,c1)},{cell_name(r1,c2)},"
-                                    f"{cell_name(r2,c1)},{cell_name(r2,c2)}. "
-                                    f"Two corners are exactly {{{d1},{d2}}}; the other two "
-                                    f"also contain extra digit {X}. To avoid a deadly pattern, "
-                                    f"{X} must occupy one of {cell_name(rr1,rc1)} or "
-                                    f"{cell_name(rr2,rc2)}. Cells seeing both cannot hold {X}."
-                                ),
-                            )
     return None
 
 
@@ -21,7 +21,7 @@ try:
     from puzzles import PUZZLES, get_puzzles_by_tier, get_all_tiers
     HAS_PUZZLES = True
 except ImportError:
-    PUZZLES, HAS_PUZZLES = [], False
+    PUZZLES, HAS_PUZZLES = (), False
 
 try:
     from sudoku_generator import generate_puzzle
@@ -86,7 +86,7 @@ async def api_puzzles():
     result = []
     for i, p in enumerate(PUZZLES):
         rows = p["rows"]
-        values = [[int(rows[r][c]) for c in range(9)] for r in range(9)]
+        values = [[rows[r][c] - 0x30 for c in range(9)] for r in range(9)]
         result.append({
             "id": i,
             "name": p["name"],
@@ -102,7 +102,7 @@ async def api_puzzle(puzzle_id: int):
         raise HTTPException(status_code=404, detail="Puzzle not found")
     p = PUZZLES[puzzle_id]
     rows = p["rows"]
-    values = [[int(rows[r][c]) for c in range(9)] for r in range(9)]
+    values = [[rows[r][c] - 0x30 for c in range(9)] for r in range(9)]
     return {"id": puzzle_id, "name": p["name"], "tier": p["tier"], "values": values}
 
 